@@ -0,0 +1,13 @@
+from .frames import FrameSequence, sample_center
+from .count import fringe_period, fringe_signal, count_fringes, fringe_table
+from .synthetic import synthetic_fringes
+
+__all__ = [
+    "FrameSequence",
+    "sample_center",
+    "fringe_period",
+    "fringe_signal",
+    "count_fringes",
+    "fringe_table",
+    "synthetic_fringes",
+]
@@ -0,0 +1,179 @@
+import numpy as np
+from scipy.ndimage import median_filter, uniform_filter1d
+from scipy.signal import hilbert
+from typing import Literal, Sequence, Tuple, Union
+
+CountMethod = Literal["phase", "zero_crossing"]
+
+
+_BACKGROUND_FRACTION = 0.2
+
+
+def _slow_background(signal: np.ndarray, fraction: float = _BACKGROUND_FRACTION) -> np.ndarray:
+    """
+    Moving median over a fixed fraction of the trace, tracking the steps between still and
+    moving segments but not the fringes. It is taken on a decimated copy to stay cheap on long videos.
+    """
+
+    window = max(int(signal.size * fraction), 3)
+    step = max(window // 32, 1)
+    coarse = median_filter(signal[::step], size=max(window // step, 3), mode="nearest")
+    return np.interp(np.arange(signal.size), np.arange(0, signal.size, step), coarse)
+
+
+def fringe_period(intensity: np.ndarray, min_snr: float = 4.0) -> float:
+    """
+    Estimate the dominant fringe period (in frames) from the FFT of the intensity trace.
+
+    The steps between still and moving segments have a strong low-frequency spectrum
+    that can outweigh the fringes, so a slow moving-median background is removed first.
+    Periods longer than an eighth of the trace are therefore not detected.
+
+    Args:
+        intensity (np.ndarray): Central intensity sampled from every frame.
+        min_snr (float): How far the spectral peak must rise above the highest peak that
+            noise alone would typically produce. Below it, no period is trusted.
+
+    Returns:
+        The period of the strongest non-DC frequency component, in frames.
+    """
+
+    signal = np.asarray(intensity, dtype=np.float64)
+    if signal.size < 4:
+        raise ValueError("At least 4 frames are needed to estimate the fringe period.")
+
+    trace = signal - _slow_background(signal)
+    power = np.abs(np.fft.rfft(trace - trace.mean())) ** 2
+    # What is left of the background lives in the lowest bins
+    lowest = min(int(np.ceil(1.5 / _BACKGROUND_FRACTION)), power.size - 1)
+    power[:lowest] = 0.0
+    peak = int(np.argmax(power))
+    if power[peak] == 0:
+        raise ValueError("The intensity trace is constant; no fringes were found.")
+
+    # The power of white noise is exponentially distributed per bin, so its largest bin
+    # is about ln(bins) times the mean, i.e. ln(bins) / ln(2) times the median
+    bins = power.size - 1
+    noise_peak = np.median(power[lowest:]) * np.log(bins) / np.log(2)
+    if power[peak] < min_snr * noise_peak:
+        raise ValueError(
+            "No fringe frequency stands out above the noise; check the sampled region "
+            "or pass the fringe period explicitly."
+        )
+    return signal.size / peak
+
+
+def fringe_signal(intensity: np.ndarray, period: float | None = None) -> np.ndarray:
+    """
+    Remove the slowly varying background and high-frequency noise from an intensity trace.
+
+    The background is estimated with a moving average spanning one fringe period,
+    which cancels the oscillation itself; a shorter moving average then smooths the noise.
+
+    Args:
+        intensity (np.ndarray): Central intensity sampled from every frame.
+        period (float, optional): Fringe period in frames. Estimated with `fringe_period` if omitted.
+
+    Returns:
+        The zero-mean fringe oscillation, one value per frame.
+    """
+
+    signal = np.asarray(intensity, dtype=np.float64)
+    if period is None:
+        period = fringe_period(signal)
+    background = uniform_filter1d(signal, size=max(int(round(period)), 1), mode="nearest")
+    oscillation = signal - background
+    smoothing = max(int(round(period / 8)), 1)
+    return uniform_filter1d(oscillation, size=smoothing, mode="nearest")
+
+
+def count_fringes(
+    intensity: np.ndarray,
+    method: CountMethod = "phase",
+    period: float | None = None,
+    hysteresis: float = 0.3,
+    min_amplitude: float = 0.5,
+) -> np.ndarray:
+    """
+    Count the fringes passing the center, frame by frame.
+
+    Args:
+        intensity (np.ndarray): Central intensity sampled from every frame.
+        method (str): Counting method.
+            - "phase": unwrap the phase of the analytic signal; gives fractional counts.
+              The phase only advances where the fringe amplitude is large enough, so frames
+              where the mirror stands still (pure noise after background removal) are not counted.
+            - "zero_crossing": count crossings of the zero line with hysteresis; gives half-fringe steps.
+        period (float, optional): Fringe period in frames. Estimated from the FFT if omitted.
+        hysteresis (float): For "zero_crossing", the dead band around zero as a fraction of
+            the signal's standard deviation. Crossings inside the band are ignored as noise.
+        min_amplitude (float): For "phase", the envelope below which the phase is frozen, as a
+            fraction of the envelope of the moving frames (its 90th percentile), which stays
+            meaningful even when the mirror is still for most of the video.
+
+    Returns:
+        The cumulative number of fringes at every frame, starting from 0.
+    """
+
+    signal = fringe_signal(intensity, period)
+
+    if method == "phase":
+        analytic = hilbert(signal)
+        envelope = np.abs(analytic)
+        steps = np.diff(np.unwrap(np.angle(analytic)))
+        # The phase of pure noise spins at random; only count it while fringes actually pass
+        moving = envelope >= min_amplitude * np.percentile(envelope, 90)
+        steps[~(moving[1:] & moving[:-1])] = 0.0
+        phase = np.concatenate(([0.0], np.cumsum(steps)))
+        return np.abs(phase) / (2 * np.pi)
+
+    if method == "zero_crossing":
+        threshold = hysteresis * signal.std()
+        state = np.zeros(signal.size, dtype=np.int8)
+        state[signal > threshold] = 1
+        state[signal < -threshold] = -1
+        # Carry the last decided state through the dead band
+        decided = np.where(state != 0, np.arange(signal.size), 0)
+        np.maximum.accumulate(decided, out=decided)
+        state = state[decided]
+        flips = np.zeros(signal.size, dtype=np.float64)
+        flips[1:] = (state[1:] != state[:-1]) & (state[:-1] != 0)
+        # Two crossings make one fringe
+        return np.cumsum(flips) / 2
+
+    raise ValueError(f"Unknown counting method: {method}")
+
+
+def fringe_table(
+    counts: np.ndarray,
+    arm_length_mm: Union[Sequence[float], np.ndarray, Tuple[float, float]],
+    step: int = 50,
+) -> Tuple[list[int], list[float]]:
+    """
+    Build the fringe count vs. arm length table used by the linear-fit cells.
+
+    Args:
+        counts (np.ndarray): Cumulative fringe count per frame, as returned by `count_fringes`.
+        arm_length_mm: Either the arm length at every frame, or a (start, end) pair of
+            micrometer readings, in which case the mirror is assumed to move uniformly.
+        step (int): Fringe count interval between table rows.
+
+    Returns:
+        A tuple (ring_count, arm_length_mm) of lists, matching `exp1_ring_count_mm` and
+        `exp1_arm_length_mm` in the notebook.
+    """
+
+    counts = np.asarray(counts, dtype=np.float64)
+    lengths = np.asarray(arm_length_mm, dtype=np.float64)
+    if lengths.shape == (2,) and counts.size != 2:
+        lengths = np.linspace(lengths[0], lengths[1], counts.size)
+    if lengths.shape != counts.shape:
+        raise ValueError("arm_length_mm must have one value per frame, or be a (start, end) pair.")
+
+    # Counts are non-decreasing, so the first frame reaching each milestone is a binary search away
+    milestones = np.arange(0, np.floor(counts[-1]) + 1, step)
+    frames = np.searchsorted(np.maximum.accumulate(counts), milestones, side="left")
+    return [int(n) for n in milestones], [float(length) for length in lengths[frames]]
+
+
+__all__ = ["fringe_period", "fringe_signal", "count_fringes", "fringe_table"]
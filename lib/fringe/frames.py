@@ -0,0 +1,130 @@
+import numpy as np
+from pathlib import Path
+from typing import Iterator, Optional, Sequence, Tuple, Union
+
+IMAGE_SUFFIXES = (".png", ".jpg", ".jpeg", ".bmp", ".tif", ".tiff")
+
+FrameSourceLike = Union[str, Path, Sequence[Union[str, Path]], np.ndarray]
+
+
+class FrameSequence:
+    """
+    A lazily-read sequence of grayscale or color frames.
+
+    Frames are never loaded all at once. A `.npy` dump of a video is opened as a
+    memory map, and image files are read one by one when their chunk is requested,
+    so memory usage only depends on the chunk size.
+
+    Args:
+        source: One of
+            - a path to a `.npy` file of shape (n, h, w) or (n, h, w, channels);
+            - a directory containing image frames (sorted by file name);
+            - a glob pattern such as "frames/*.png";
+            - a list of image paths, in frame order;
+            - an in-memory array of shape (n, h, w) or (n, h, w, channels).
+    """
+
+    def __init__(self, source: FrameSourceLike):
+        self._array: Optional[np.ndarray] = None
+        self._paths: list[Path] = []
+
+        if isinstance(source, np.ndarray):
+            self._array = source
+        elif isinstance(source, (str, Path)):
+            path = Path(source)
+            if path.suffix == ".npy":
+                self._array = np.load(path, mmap_mode="r")
+            elif path.is_dir():
+                self._paths = sorted(p for p in path.iterdir() if p.suffix.lower() in IMAGE_SUFFIXES)
+            else:
+                self._paths = sorted(path.parent.glob(path.name))
+        else:
+            self._paths = [Path(p) for p in source]
+
+        if self._array is not None:
+            if self._array.ndim not in (3, 4):
+                raise ValueError(f"Expected frames of shape (n, h, w[, c]), got {self._array.shape}.")
+        elif not self._paths:
+            raise FileNotFoundError(f"No frames found at {source}.")
+
+    def __len__(self) -> int:
+        if self._array is not None:
+            return self._array.shape[0]
+        return len(self._paths)
+
+    @property
+    def frame_shape(self) -> Tuple[int, int]:
+        """The (height, width) of a single frame."""
+        if self._array is not None:
+            return self._array.shape[1], self._array.shape[2]
+        first = _read_image(self._paths[0])
+        return first.shape[0], first.shape[1]
+
+    def chunks(self, chunk_size: int = 512, region: Optional[Tuple[slice, slice]] = None) -> Iterator[np.ndarray]:
+        """
+        Yield consecutive blocks of at most `chunk_size` frames.
+
+        Args:
+            chunk_size: Maximum number of frames per block.
+            region: Optional (rows, cols) slices. When given, only this region of each
+                frame is read, which keeps memory-mapped reads small.
+
+        Yields:
+            Arrays of shape (k, h, w) or (k, h, w, channels).
+        """
+        rows, cols = region if region is not None else (slice(None), slice(None))
+        for start in range(0, len(self), chunk_size):
+            stop = min(start + chunk_size, len(self))
+            if self._array is not None:
+                yield np.asarray(self._array[start:stop, rows, cols])
+            else:
+                yield np.stack([_read_image(p)[rows, cols] for p in self._paths[start:stop]])
+
+
+def _read_image(path: Path) -> np.ndarray:
+    """Read a single image file into an array."""
+    from matplotlib import image as mpimg
+
+    return mpimg.imread(str(path))
+
+
+def sample_center(
+    frames: Union[FrameSequence, FrameSourceLike],
+    radius: int = 4,
+    center: Optional[Tuple[int, int]] = None,
+    chunk_size: int = 512,
+) -> np.ndarray:
+    """
+    Sample the mean intensity of a small square around the fringe center in every frame.
+
+    Args:
+        frames: A FrameSequence, or anything accepted by FrameSequence.
+        radius: Half-width of the sampled square, in pixels.
+        center: (row, col) of the fringe center. Defaults to the middle of the frame.
+        chunk_size: Number of frames read per block.
+
+    Returns:
+        A float64 array with one intensity value per frame.
+    """
+
+    if not isinstance(frames, FrameSequence):
+        frames = FrameSequence(frames)
+
+    height, width = frames.frame_shape
+    row, col = center if center is not None else (height // 2, width // 2)
+    region = (
+        slice(max(row - radius, 0), min(row + radius + 1, height)),
+        slice(max(col - radius, 0), min(col + radius + 1, width)),
+    )
+
+    intensity = np.empty(len(frames), dtype=np.float64)
+    position = 0
+    for block in frames.chunks(chunk_size, region=region):
+        # Average over the pixels (and color channels, if any) of each frame
+        values = block.reshape(block.shape[0], -1).mean(axis=1, dtype=np.float64)
+        intensity[position:position + len(values)] = values
+        position += len(values)
+    return intensity
+
+
+__all__ = ["FrameSequence", "sample_center"]
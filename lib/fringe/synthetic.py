@@ -0,0 +1,79 @@
+import numpy as np
+from pathlib import Path
+from typing import Optional, Sequence, Tuple, Union
+
+
+def synthetic_fringes(
+    n_frames: int,
+    fringes: float,
+    shape: Tuple[int, int] = (64, 64),
+    noise: float = 0.05,
+    path: Optional[Union[str, Path]] = None,
+    chunk_size: int = 512,
+    seed: int = 0,
+    velocity: Optional[Union[Sequence[float], np.ndarray]] = None,
+) -> np.ndarray:
+    """
+    Generate a video of concentric Michelson fringes expanding from the center.
+
+    Useful for checking the fringe counter against a known answer, including videos
+    where the mirror stands still at the ends or pauses in between.
+
+    Args:
+        n_frames: Number of frames.
+        fringes: Total number of fringes that pass the center over the whole video.
+        shape: (height, width) of each frame.
+        noise: Standard deviation of the additive Gaussian noise, relative to the fringe contrast.
+        path: If given, the video is written chunk by chunk to this `.npy` file and
+            returned as a read-only memory map, so large videos never sit in memory.
+        chunk_size: Number of frames generated at a time.
+        seed: Seed of the noise generator.
+        velocity: Relative speed of the mirror at every frame. Zeros are pauses, where the
+            mirror stands still. It is rescaled so that `fringes` fringes still pass in
+            total. Defaults to a uniform motion.
+
+    Returns:
+        An array of shape (n_frames, height, width) with values in roughly [0, 1].
+
+    Example:
+        >>> # Still for 2000 frames at each end, and a 2000-frame pause halfway
+        >>> velocity = np.ones(20000)
+        >>> velocity[:2000] = velocity[-2000:] = velocity[9000:11000] = 0
+        >>> video = synthetic_fringes(20000, fringes=100, velocity=velocity)
+    """
+
+    rng = np.random.default_rng(seed)
+    height, width = shape
+    rows, cols = np.ogrid[:height, :width]
+    radius_sq = ((rows - height / 2) ** 2 + (cols - width / 2) ** 2) / (min(height, width) / 2) ** 2
+    # The central phase advances with the mirror; rings grow outwards from the center
+    if velocity is None:
+        phase = np.linspace(0, 2 * np.pi * fringes, n_frames)
+    else:
+        steps = np.abs(np.asarray(velocity, dtype=np.float64))
+        if steps.shape != (n_frames,):
+            raise ValueError("velocity must have one value per frame.")
+        if steps[1:].sum() == 0:
+            raise ValueError("velocity must be nonzero somewhere, or no fringe can pass.")
+        phase = np.concatenate(([0.0], np.cumsum(steps[1:])))
+        phase *= 2 * np.pi * fringes / phase[-1]
+
+    if path is not None:
+        video = np.lib.format.open_memmap(Path(path), mode="w+", dtype=np.float32, shape=(n_frames, height, width))
+    else:
+        video = np.empty((n_frames, height, width), dtype=np.float32)
+
+    for start in range(0, n_frames, chunk_size):
+        stop = min(start + chunk_size, n_frames)
+        block = 0.5 + 0.5 * np.cos(phase[start:stop, None, None] - 4 * np.pi * radius_sq)
+        block += rng.normal(0.0, noise, size=block.shape)
+        video[start:stop] = block
+
+    if path is not None:
+        video.flush()  # type: ignore[attr-defined]
+        del video
+        return np.load(Path(path), mmap_mode="r")
+    return video
+
+
+__all__ = ["synthetic_fringes"]
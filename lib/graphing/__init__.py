@@ -1,5 +1,6 @@
 from . import origin # noqa: F401 - import for side effects
 from .utils import plot_graph  # noqa: F401
+from .templates import FigureTemplate, FigurePool  # noqa: F401
 
 import os
 os.makedirs("output", exist_ok=True)
@@ -7,4 +8,6 @@ os.makedirs("output", exist_ok=True)
 __all__ = [
     "origin",
     "plot_graph",
+    "FigureTemplate",
+    "FigurePool",
 ]
\ No newline at end of file
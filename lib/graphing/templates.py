@@ -0,0 +1,211 @@
+from collections import OrderedDict
+from matplotlib.axes import Axes
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+from matplotlib.figure import Figure
+from matplotlib.lines import Line2D
+from matplotlib.table import Table
+from matplotlib.text import Text
+from pathlib import Path
+from typing import IO, Any, Callable, Optional, Tuple, Union, cast, TYPE_CHECKING
+
+from .utils import add_signature, set_signature
+
+if TYPE_CHECKING:
+    from me import Student
+
+# Signature cells are left blank until `set_signature` fills them
+_BLANK_STUDENT = cast("Student", {"student_name": "", "student_id": "", "class_name": ""})
+
+
+class FigureTemplate:
+    """
+    A figure that is built once and then refilled with new data for every export.
+
+    The figure is created without pyplot, so it is not kept alive by pyplot's figure
+    registry; it is freed as soon as the template is closed or dropped. Artists are
+    registered under a key when the layout is built, and later updated in place with
+    `set_data` / `set_text` / `set_signature` instead of being recreated.
+
+    Args:
+        figsize (tuple, optional): Figure size in inches. Defaults to rcParams["figure.figsize"], like pyplot.
+        nrows (int): Number of subplot rows.
+        ncols (int): Number of subplot columns.
+    """
+
+    def __init__(self, figsize: Optional[Tuple[float, float]] = None, nrows: int = 1, ncols: int = 1):
+        self.fig = Figure(figsize=figsize)
+        FigureCanvasAgg(self.fig)
+        axes = self.fig.subplots(nrows, ncols, squeeze=False)
+        self.axes: list[Axes] = list(axes.flat)
+        self.lines: dict[str, Line2D] = {}
+        self.texts: dict[str, Text] = {}
+        self.signatures: list[Table] = []
+
+    @property
+    def ax(self) -> Axes:
+        """The first (or only) axes of the figure."""
+        return self.axes[0]
+
+    def line(self, key: str, ax: Optional[Axes] = None, **style: Any) -> Line2D:
+        """Create an empty line (or marker series, with linestyle='') registered under `key`."""
+        (artist,) = (ax or self.ax).plot([], [], **style)
+        self.lines[key] = artist
+        return artist
+
+    def text(self, key: str, x: float, y: float, ax: Optional[Axes] = None, **style: Any) -> Text:
+        """Create an empty text registered under `key`, positioned in axes coordinates by default."""
+        target = ax or self.ax
+        style.setdefault("transform", target.transAxes)
+        artist = target.text(x, y, "", **style)
+        self.texts[key] = artist
+        return artist
+
+    def signature(
+        self,
+        date: str = "",
+        position: str = "lower right",
+        scale: float = 1.0,
+        student: Optional["Student"] = None,
+        ax: Optional[Axes] = None,
+    ) -> Table:
+        """
+        Add a signature table, which `set_signature` keeps up to date. See `add_signature`.
+
+        Unlike `add_signature`, me.yaml is not read when no student is given; the student
+        cells stay blank until `set_signature` fills them. Layouts can therefore be built
+        where there is no me.yaml, e.g. in a batch job that signs every dataset differently.
+        """
+        table = add_signature(ax or self.ax, date=date, position=position, scale=scale, student=student or _BLANK_STUDENT)
+        self.signatures.append(table)
+        return table
+
+    def set_data(self, key: str, x, y) -> None:
+        """Replace the data of a registered line."""
+        self.lines[key].set_data(x, y)
+
+    def set_text(self, key: str, text: str) -> None:
+        """Replace the content of a registered text."""
+        self.texts[key].set_text(text)
+
+    def set_signature(self, date: Optional[str] = None, student: Optional["Student"] = None) -> None:
+        """Update the date and/or student shown in every signature table."""
+        for table in self.signatures:
+            set_signature(table, date=date, student=student)
+
+    def rescale(self) -> None:
+        """Recompute the data limits of every axes after its data changed."""
+        for ax in self.axes:
+            ax.relim()
+            ax.autoscale_view()
+
+    def export(self, path: Union[str, Path, IO[bytes]], dpi: int = 300, **kwargs: Any) -> None:
+        """Render the figure and save it, like `plt.savefig`."""
+        self.fig.savefig(path, dpi=dpi, **kwargs)
+
+    def _repr_png_(self) -> bytes:
+        """
+        Render for IPython's display. The figure is not known to pyplot, so the inline
+        backend may not have registered a PNG formatter for it; the template renders itself.
+        """
+        import io
+
+        buffer = io.BytesIO()
+        self.fig.savefig(buffer, format="png")
+        return buffer.getvalue()
+
+    def close(self) -> None:
+        """Release every artist of the figure. The template cannot be used afterwards."""
+        self.fig.clear()
+        self.lines.clear()
+        self.texts.clear()
+        self.signatures.clear()
+
+    def __enter__(self) -> "FigureTemplate":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+
+class FigurePool:
+    """
+    Keep one FigureTemplate per layout, building each layout only on first use.
+
+    Long-running batch jobs (e.g. generating plots for every student of a class) can
+    ask the pool for a layout once per dataset; the figure, axes, grid and signature
+    are reused and only the data is refreshed. At most `max_size` layouts are kept;
+    the least recently used one is closed when the pool is full.
+
+    Args:
+        max_size (int): Maximum number of templates kept alive.
+
+    Example:
+        >>> def build(t: FigureTemplate):
+        ...     t.line("data", color="black", marker="s", linestyle="")
+        ...     t.signature(position="lower right")
+        >>> with FigurePool() as pool:
+        ...     for student, (x, y) in datasets:
+        ...         t = pool.get("curve", build)
+        ...         t.set_data("data", x, y)
+        ...         t.set_signature(date=date, student=student)
+        ...         t.rescale()
+        ...         t.export(f"output/{student['student_id']}.png")
+    """
+
+    def __init__(self, max_size: int = 8):
+        self.max_size = max_size
+        self._templates: "OrderedDict[str, FigureTemplate]" = OrderedDict()
+
+    def get(
+        self,
+        layout: str,
+        build: Callable[[FigureTemplate], None],
+        figsize: Optional[Tuple[float, float]] = None,
+        nrows: int = 1,
+        ncols: int = 1,
+    ) -> FigureTemplate:
+        """
+        Get the template of a layout, building it with `build(template)` on first use.
+
+        Args:
+            layout (str): Name of the layout.
+            build (Callable): Adds the layout's axes decorations and keyed artists to a new template.
+            figsize, nrows, ncols: Passed to FigureTemplate when the layout is built.
+        """
+
+        template = self._templates.get(layout)
+        if template is not None:
+            self._templates.move_to_end(layout)
+            return template
+
+        template = FigureTemplate(figsize=figsize, nrows=nrows, ncols=ncols)
+        build(template)
+        self._templates[layout] = template
+        while len(self._templates) > self.max_size:
+            _, evicted = self._templates.popitem(last=False)
+            evicted.close()
+        return template
+
+    def release(self, layout: str) -> None:
+        """Close and forget the template of a layout."""
+        template = self._templates.pop(layout, None)
+        if template is not None:
+            template.close()
+
+    def close(self) -> None:
+        """Close every template in the pool."""
+        for template in self._templates.values():
+            template.close()
+        self._templates.clear()
+
+    def __len__(self) -> int:
+        return len(self._templates)
+
+    def __enter__(self) -> "FigurePool":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+
+__all__ = ["FigureTemplate", "FigurePool"]
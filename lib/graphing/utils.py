@@ -1,8 +1,12 @@
 import numpy as np
 from scipy.stats import linregress
 from matplotlib.axes import Axes
+from matplotlib.table import Table
 from matplotlib.transforms import Bbox
-from typing import Tuple
+from typing import Optional, Tuple, TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from me import Student
 
 
 def set_margin(x: float, y: float) -> None:
@@ -158,7 +162,7 @@ def plot_graph(ax, x_data, y_data, options) -> dict:
 
     return ret
 
-def add_signature(ax: Axes, date: str, position: str = "lower right", scale: float = 1.0) -> None:
+def add_signature(ax: Axes, date: str, position: str = "lower right", scale: float = 1.0, student: Optional["Student"] = None) -> Table:
     """
     Add a signature box with the date to the specified axes.
 
@@ -167,6 +171,10 @@ def add_signature(ax: Axes, date: str, position: str = "lower right", scale: flo
         date (str): The date string to display.
         position (str): The position of the signature box.
             Options: 'upper left', 'upper right', 'lower left', 'lower right'
+        student (me.Student, optional): The student to sign with. Defaults to the one in me.yaml.
+
+    Returns:
+        The signature table, whose cells can be updated in place (see `set_signature`).
     """
 
     bbox_map = {
@@ -177,13 +185,14 @@ def add_signature(ax: Axes, date: str, position: str = "lower right", scale: flo
     }
     x, y, w, h = bbox_map.get(position, bbox_map["lower right"])
 
-    import me
-    about = me.get()
+    if student is None:
+        import me
+        student = me.get()
     table = ax.table(
         cellText=[
-            ["学生姓名", about['student_name']],
-            ["学号", str(about['student_id'])],
-            ["班级", about['class_name']],
+            ["学生姓名", student['student_name']],
+            ["学号", str(student['student_id'])],
+            ["班级", student['class_name']],
             ["实验日期", date],
         ],
         colWidths=[0.3, 0.7],
@@ -196,6 +205,25 @@ def add_signature(ax: Axes, date: str, position: str = "lower right", scale: flo
     )
     for key, cell in table.get_celld().items():
         cell.set_facecolor('w')
+    return table
+
+def set_signature(table: Table, date: Optional[str] = None, student: Optional["Student"] = None) -> None:
+    """
+    Update the cells of a signature table created by `add_signature`, without rebuilding it.
+
+    Args:
+        table (matplotlib.table.Table): The signature table.
+        date (str, optional): The new date string.
+        student (me.Student, optional): The new student information.
+    """
+
+    cells = table.get_celld()
+    if student is not None:
+        cells[(0, 1)].get_text().set_text(student['student_name'])
+        cells[(1, 1)].get_text().set_text(str(student['student_id']))
+        cells[(2, 1)].get_text().set_text(student['class_name'])
+    if date is not None:
+        cells[(3, 1)].get_text().set_text(date)
 
 def add_grid(ax: Axes, x: Tuple[float, float], y: Tuple[float, float]):
     """
@@ -0,0 +1,17 @@
+from .buffer import RingBuffer
+from .sources import StreamSource, SerialSource, SimulatedSource
+from .analysis import LineFit, IncrementalLinearFit, SegmentFits
+from .acquire import Acquisition
+from .plot import LivePlot
+
+__all__ = [
+    "RingBuffer",
+    "StreamSource",
+    "SerialSource",
+    "SimulatedSource",
+    "LineFit",
+    "IncrementalLinearFit",
+    "SegmentFits",
+    "Acquisition",
+    "LivePlot",
+]
@@ -0,0 +1,53 @@
+import argparse
+from rich import print
+
+import graphing  # noqa: F401 - import for side effects
+from .acquire import Acquisition
+from .analysis import SegmentFits
+from .plot import LivePlot
+from .sources import SerialSource, SimulatedSource, StreamSource
+
+
+def parse_segment(text: str) -> tuple[float, float]:
+    start, end = text.split(":")
+    return float(start), float(end)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Live acquisition for the liquid nitrogen experiment")
+    parser.add_argument("--source", default="simulated", help='"simulated", a device/FIFO path, or serial:PORT')
+    parser.add_argument("--baudrate", type=int, default=9600, help="Baud rate, for serial:PORT sources")
+    parser.add_argument("--frequency", type=float, default=9.0, help="Sampling frequency in Hz")
+    parser.add_argument("--segments", type=parse_segment, nargs="+", default=[(380, 450), (550, 685), (785, 900)],
+                        help="Segment windows as START:END in seconds")
+    parser.add_argument("--fps", type=float, default=10.0, help="Maximum plot refresh rate")
+    parser.add_argument("--save", metavar="PATH",
+                        help='Write every sample to this file in the logger\'s format, e.g. "data/nitrogen-weight-map.txt" for 实验2-2')
+    parser.add_argument("--figure", metavar="PATH", default="output/液氮汽化实验中称重电压与时间关系（实时）.png",
+                        help="Where to save the final plot")
+    args = parser.parse_args()
+
+    if args.source == "simulated":
+        source = SimulatedSource(sample_frequency_hz=args.frequency)
+    elif args.source.startswith("serial:"):
+        source = SerialSource(args.source.removeprefix("serial:"), args.baudrate, sample_frequency_hz=args.frequency)
+    else:
+        source = StreamSource(args.source, sample_frequency_hz=args.frequency)
+
+    analysis = SegmentFits(args.segments)
+    with Acquisition(source, analysis=analysis, save_path=args.save) as acquisition:
+        plot = LivePlot(acquisition, max_fps=args.fps)
+        if args.figure:
+            print(f"[green]The final plot will be saved to {args.figure} when the acquisition ends; close the window to exit.[/green]")
+        plot.run(figure_path=args.figure)
+
+    if acquisition.error is not None:
+        print(f"[red]Acquisition stopped with an error:[/red] {acquisition.error}")
+    if args.save:
+        print(f"[green]✅ {acquisition.buffer.total} samples saved to {args.save}[/green]")
+    for i, fit in enumerate(analysis.results(), start=1):
+        if fit is not None:
+            print(f"Segment {i}: slope = {fit.slope:.5e} V/s, intercept = {fit.intercept:.5e} V")
+    for i, drop in enumerate(analysis.drops(), start=1):
+        if drop is not None:
+            print(f"Segment {i}→{i + 1}: Voltage Drop ΔU = {drop:.4e} V")
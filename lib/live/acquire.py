@@ -0,0 +1,133 @@
+import numpy as np
+import time
+from pathlib import Path
+from threading import Event, Thread
+from typing import IO, Iterable, Optional, Tuple, Union
+
+from .analysis import SegmentFits
+from .buffer import RingBuffer
+
+
+class Acquisition:
+    """
+    Pull samples from a source on a background thread into a ring buffer.
+
+    Samples are collected in small batches; each batch is written to the buffer and
+    fed to the incremental segment analysis in one vectorized step, so the analysis
+    is always up to date with the data.
+
+    A source may yield None when no sample arrived for a while (StreamSource does so
+    every `poll_interval_s`). The acquisition then flushes samples that have waited
+    longer than `batch_interval_s` and checks for a stop request, so neither depends
+    on the next sample arriving.
+
+    Args:
+        source (Iterable[Tuple[float, float] | None]): Yields (time, value) samples, e.g. a StreamSource.
+        capacity (int): Number of samples kept in the ring buffer.
+        analysis (SegmentFits, optional): Incremental analysis to update as data arrives.
+        batch_size (int): Maximum number of samples per batch.
+        batch_interval_s (float): Maximum time a sample waits before its batch is flushed.
+        save_path (str | Path, optional): If given, every sample is also appended to this text
+            file as it is flushed, one "time value" row per line after a header line, the
+            format the logger writes and 实验2-2 reads. The ring buffer only keeps the most
+            recent samples; this file keeps the whole run.
+    """
+
+    def __init__(
+        self,
+        source: Iterable[Optional[Tuple[float, float]]],
+        capacity: int = 1 << 16,
+        analysis: Optional[SegmentFits] = None,
+        batch_size: int = 64,
+        batch_interval_s: float = 0.1,
+        save_path: Optional[Union[str, Path]] = None,
+    ):
+        self.source = source
+        self.buffer = RingBuffer(capacity, columns=2)
+        self.analysis = analysis
+        self.batch_size = batch_size
+        self.batch_interval_s = batch_interval_s
+        self.save_path = None if save_path is None else Path(save_path)
+        self._file: Optional[IO[str]] = None
+        self.error: Optional[BaseException] = None
+        self._stop = Event()
+        self._done = Event()
+        self._thread = Thread(target=self._run, name="sjphy-acquisition", daemon=True)
+
+    @property
+    def running(self) -> bool:
+        return self._thread.is_alive()
+
+    @property
+    def finished(self) -> bool:
+        """True once the source is exhausted, the acquisition was stopped, or it failed."""
+        return self._done.is_set()
+
+    def start(self) -> "Acquisition":
+        self._thread.start()
+        return self
+
+    def stop(self, timeout: Optional[float] = None) -> None:
+        """
+        Ask the acquisition to stop at the next sample or idle tick of the source, and wait for the thread.
+
+        A source that blocks without ever yielding can keep the thread alive; pass a
+        `timeout` to give up waiting. The thread is a daemon, so it does not keep the program running.
+        """
+        self._stop.set()
+        if self._thread.is_alive():
+            self._thread.join(timeout)
+
+    def wait(self, timeout: Optional[float] = None) -> bool:
+        """Block until the acquisition finishes. Returns False on timeout."""
+        return self._done.wait(timeout)
+
+    def __enter__(self) -> "Acquisition":
+        return self.start()
+
+    def __exit__(self, *exc) -> None:
+        self.stop(timeout=max(1.0, 10 * self.batch_interval_s))
+
+    def _flush(self, batch: list[Tuple[float, float]]) -> None:
+        if not batch:
+            return
+        rows = np.array(batch, dtype=np.float64)
+        self.buffer.extend(rows)
+        if self._file is not None:
+            np.savetxt(self._file, rows, fmt="%.9g", delimiter="\t")
+            self._file.flush()
+        if self.analysis is not None:
+            self.analysis.update(rows[:, 0], rows[:, 1])
+        batch.clear()
+
+    def _run(self) -> None:
+        batch: list[Tuple[float, float]] = []
+        deadline = time.monotonic() + self.batch_interval_s
+        try:
+            if self.save_path is not None:
+                self.save_path.parent.mkdir(parents=True, exist_ok=True)
+                # ASCII only, so it reads back with the notebook's encoding whatever it is set to
+                self._file = open(self.save_path, "w", encoding="ascii")
+                self._file.write("time/s\tvoltage/V\n")
+            for sample in self.source:
+                if self._stop.is_set():
+                    break
+                if sample is not None:
+                    batch.append(sample)
+                now = time.monotonic()
+                if len(batch) >= self.batch_size or now >= deadline:
+                    self._flush(batch)
+                    deadline = now + self.batch_interval_s
+        except BaseException as e:
+            self.error = e
+        finally:
+            try:
+                self._flush(batch)
+            finally:
+                if self._file is not None:
+                    self._file.close()
+                    self._file = None
+                self._done.set()
+
+
+__all__ = ["Acquisition"]
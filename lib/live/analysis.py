@@ -0,0 +1,126 @@
+import numpy as np
+from dataclasses import dataclass
+from threading import Lock
+from typing import Optional, Sequence, Tuple
+
+
+@dataclass
+class LineFit:
+    """A least-squares line fitted to one segment."""
+    slope: float
+    intercept: float
+    r_squared: float
+    count: int
+
+    def evaluate(self, x: np.ndarray | float) -> np.ndarray | float:
+        return self.slope * x + self.intercept
+
+
+class IncrementalLinearFit:
+    """
+    Least-squares line fit that is updated sample by sample.
+
+    Only running sums are stored, so adding a block of samples costs O(block size) and
+    reading the current fit costs O(1). Both coordinates are shifted by the first sample
+    to keep the sums well conditioned.
+    """
+
+    def __init__(self):
+        self._origin: Optional[Tuple[float, float]] = None
+        self._n = 0
+        self._sx = self._sy = self._sxx = self._sxy = self._syy = 0.0
+
+    @property
+    def count(self) -> int:
+        return self._n
+
+    def update(self, x: np.ndarray, y: np.ndarray) -> None:
+        """Add a block of samples."""
+        x = np.asarray(x, dtype=np.float64)
+        y = np.asarray(y, dtype=np.float64)
+        if x.size == 0:
+            return
+        if self._origin is None:
+            self._origin = (float(x[0]), float(y[0]))
+        dx = x - self._origin[0]
+        dy = y - self._origin[1]
+        self._n += x.size
+        self._sx += dx.sum()
+        self._sy += dy.sum()
+        self._sxx += dx @ dx
+        self._sxy += dx @ dy
+        self._syy += dy @ dy
+
+    def result(self) -> Optional[LineFit]:
+        """The current fit, or None while fewer than two distinct samples have been seen."""
+        n = self._n
+        var_x = self._sxx - self._sx**2 / n if n else 0.0
+        if n < 2 or var_x <= 0 or self._origin is None:
+            return None
+        cov_xy = self._sxy - self._sx * self._sy / n
+        var_y = self._syy - self._sy**2 / n
+        slope = cov_xy / var_x
+        x0, y0 = self._origin
+        intercept = y0 + self._sy / n - slope * (x0 + self._sx / n)
+        r_squared = cov_xy**2 / (var_x * var_y) if var_y > 0 else 1.0
+        return LineFit(slope=slope, intercept=intercept, r_squared=r_squared, count=n)
+
+
+class SegmentFits:
+    """
+    Incremental version of the segment analysis in 实验2-2.
+
+    Each incoming sample is routed to the segment whose (start, end) window contains
+    its time, after dropping samples below `min_value` like the notebook's filter_data.
+    The voltage drops between consecutive segments are available at any moment.
+
+    Args:
+        thresholds (Sequence[Tuple[float, float]]): (start, end) time windows of the segments, in s.
+        min_value (float, optional): Samples with a smaller value are discarded as jumps.
+    """
+
+    def __init__(self, thresholds: Sequence[Tuple[float, float]], min_value: Optional[float] = 0.00025):
+        self.thresholds = [tuple(edge) for edge in thresholds]
+        self.min_value = min_value
+        self._fits = [IncrementalLinearFit() for _ in self.thresholds]
+        self._lock = Lock()
+
+    def update(self, t: np.ndarray, u: np.ndarray) -> None:
+        """Add a block of (time, value) samples."""
+        t = np.asarray(t, dtype=np.float64)
+        u = np.asarray(u, dtype=np.float64)
+        if self.min_value is not None:
+            keep = u >= self.min_value
+            t, u = t[keep], u[keep]
+        with self._lock:
+            for (start, end), fit in zip(self.thresholds, self._fits):
+                mask = (start < t) & (t < end)
+                if mask.any():
+                    fit.update(t[mask], u[mask])
+
+    def results(self) -> list[Optional[LineFit]]:
+        """The current fit of every segment; None for segments without enough data yet."""
+        with self._lock:
+            return [fit.result() for fit in self._fits]
+
+    def drops(self) -> list[Optional[float]]:
+        """
+        The value drop between each pair of consecutive segments.
+
+        Both lines are evaluated halfway between the end of one window and the start of
+        the next, as in the notebook. None while either segment has no fit yet.
+        """
+
+        results = self.results()
+        drops = []
+        for i in range(len(results) - 1):
+            before, after = results[i], results[i + 1]
+            if before is None or after is None:
+                drops.append(None)
+                continue
+            sample_time = (self.thresholds[i][1] + self.thresholds[i + 1][0]) / 2
+            drops.append(abs(float(before.evaluate(sample_time) - after.evaluate(sample_time))))
+        return drops
+
+
+__all__ = ["LineFit", "IncrementalLinearFit", "SegmentFits"]
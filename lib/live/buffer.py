@@ -0,0 +1,71 @@
+import numpy as np
+from threading import Lock
+
+
+class RingBuffer:
+    """
+    A fixed-size, thread-safe buffer of the most recent samples.
+
+    Samples are rows of `columns` floats (e.g. time and voltage). Once `capacity`
+    rows have been written, each new row overwrites the oldest one, so memory use
+    stays constant no matter how long the acquisition runs.
+
+    Args:
+        capacity (int): Maximum number of rows kept.
+        columns (int): Number of values per row.
+    """
+
+    def __init__(self, capacity: int, columns: int = 2):
+        if capacity <= 0:
+            raise ValueError("capacity must be positive.")
+        self._data = np.empty((capacity, columns), dtype=np.float64)
+        self._capacity = capacity
+        self._head = 0  # index of the next write
+        self._total = 0  # rows written since creation
+        self._lock = Lock()
+
+    @property
+    def capacity(self) -> int:
+        return self._capacity
+
+    @property
+    def total(self) -> int:
+        """Number of rows written since creation, including overwritten ones."""
+        return self._total
+
+    def __len__(self) -> int:
+        return min(self._total, self._capacity)
+
+    def extend(self, rows: np.ndarray) -> None:
+        """Append a block of rows of shape (n, columns)."""
+        rows = np.asarray(rows, dtype=np.float64).reshape(-1, self._data.shape[1])
+        if len(rows) > self._capacity:
+            rows = rows[-self._capacity:]
+        with self._lock:
+            first = min(len(rows), self._capacity - self._head)
+            self._data[self._head:self._head + first] = rows[:first]
+            self._data[:len(rows) - first] = rows[first:]
+            self._head = (self._head + len(rows)) % self._capacity
+            self._total += len(rows)
+
+    def append(self, *values: float) -> None:
+        """Append a single row."""
+        self.extend(np.array(values, dtype=np.float64))
+
+    def snapshot(self, last: int | None = None) -> np.ndarray:
+        """
+        Copy the buffered rows out, oldest first.
+
+        Args:
+            last (int, optional): Only return the most recent `last` rows.
+        """
+
+        with self._lock:
+            size = len(self) if last is None else min(last, len(self))
+            start = (self._head - size) % self._capacity
+            if start + size <= self._capacity:
+                return self._data[start:start + size].copy()
+            return np.concatenate((self._data[start:], self._data[:self._head]))
+
+
+__all__ = ["RingBuffer"]
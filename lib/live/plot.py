@@ -0,0 +1,161 @@
+import numpy as np
+import time
+from pathlib import Path
+from typing import Optional, Union
+
+from .acquire import Acquisition
+
+
+class LivePlot:
+    """
+    Real-time plot of an acquisition, redrawn with blitting.
+
+    The axes, grid and labels are rendered once and cached as a background image.
+    Each frame only restores that background and redraws the data and fit lines, and
+    frames are throttled to `max_fps`. A full redraw happens only when the data leaves
+    the current axis limits.
+
+    Args:
+        acquisition (Acquisition): The running acquisition to display.
+        max_fps (float): Upper bound on the number of frames drawn per second.
+        window_s (float, optional): If given, only the most recent `window_s` seconds are shown.
+        title (str): Title of the plot.
+    """
+
+    def __init__(
+        self,
+        acquisition: Acquisition,
+        max_fps: float = 10.0,
+        window_s: Optional[float] = None,
+        title: str = "液氮汽化实验中称重电压与时间关系（实时）",
+    ):
+        import matplotlib.pyplot as plt
+
+        self.acquisition = acquisition
+        self.frame_interval_s = 1 / max_fps
+        self.window_s = window_s
+
+        self.fig, self.ax = plt.subplots(figsize=(10, 7))
+        self.ax.set_title(title)
+        self.ax.set_xlabel("时间 t / s")
+        self.ax.set_ylabel("称重电压 U / V")
+        self.ax.grid(True)
+
+        (self._points,) = self.ax.plot([], [], marker="o", linestyle="", markersize=1.5, color="black", animated=True)
+        self._fit_lines = []
+        self._text = self.ax.text(
+            0.02, 0.02, "", transform=self.ax.transAxes, fontsize=12, va="bottom", animated=True,
+            bbox=dict(boxstyle="round,pad=0.5", fc="white", alpha=0.6),
+        )
+
+        analysis = acquisition.analysis
+        if analysis is not None:
+            for start, end in analysis.thresholds:
+                self.ax.axvspan(start, end, color="black", alpha=0.1)
+            self._fit_lines = [self.ax.plot([], [], linewidth=1, animated=True)[0] for _ in analysis.thresholds]
+
+        self._background = None
+        self._limits = (0.0, 1.0, 0.0, 1.0)
+        self.fig.canvas.mpl_connect("draw_event", self._on_draw)
+
+    def _on_draw(self, event) -> None:
+        # Any full redraw (first show, resize, rescale) invalidates the cached background
+        self._background = self.fig.canvas.copy_from_bbox(self.fig.bbox)
+        self._draw_artists()
+
+    def _artists(self) -> list:
+        return [self._points, *self._fit_lines, self._text]
+
+    def _draw_artists(self) -> None:
+        for artist in self._artists():
+            self.ax.draw_artist(artist)
+
+    def _rescale(self, t: np.ndarray, u: np.ndarray) -> bool:
+        """Grow the axis limits with some headroom if the data left them. Returns True if they changed."""
+        x0, x1, y0, y1 = self._limits
+        if t.size == 0 or (t.min() >= x0 and t.max() <= x1 and u.min() >= y0 and u.max() <= y1):
+            return False
+        t_span = max(t.max() - t.min(), 1.0)
+        u_span = max(u.max() - u.min(), abs(u.max()) * 1e-3, 1e-12)
+        self._limits = (t.min(), t.max() + 0.25 * t_span, u.min() - 0.1 * u_span, u.max() + 0.1 * u_span)
+        self.ax.set_xlim(self._limits[0], self._limits[1])
+        self.ax.set_ylim(self._limits[2], self._limits[3])
+        return True
+
+    def _refresh(self) -> bool:
+        """Load the current contents of the ring buffer into the artists. Returns True if the axes were rescaled."""
+        data = self.acquisition.buffer.snapshot()
+        t, u = data[:, 0], data[:, 1]
+        if self.window_s is not None and t.size:
+            recent = t >= t[-1] - self.window_s
+            t, u = t[recent], u[recent]
+        self._points.set_data(t, u)
+
+        analysis = self.acquisition.analysis
+        if analysis is not None:
+            lines = []
+            for line, fit in zip(self._fit_lines, analysis.results()):
+                if fit is None or t.size == 0:
+                    line.set_data([], [])
+                    continue
+                t_line = np.array([t.min(), t.max()])
+                line.set_data(t_line, fit.evaluate(t_line))
+                lines.append(f"k={fit.slope:.2e} V/s")
+            drops = ", ".join("—" if d is None else f"{d:.3e} V" for d in analysis.drops())
+            self._text.set_text(f"斜率: {'; '.join(lines) or '—'}\nΔU: {drops or '—'}")
+
+        return self._rescale(t, u)
+
+    def update(self) -> None:
+        """Draw one frame from the current contents of the ring buffer."""
+        rescaled = self._refresh()
+        canvas = self.fig.canvas
+        if rescaled or self._background is None:
+            canvas.draw()  # triggers _on_draw, which caches the background and draws the artists
+        else:
+            canvas.restore_region(self._background)
+            self._draw_artists()
+            canvas.blit(self.fig.bbox)
+        canvas.flush_events()
+
+    def save(self, path: Union[str, Path], dpi: int = 300) -> None:
+        """Save the current frame, including the animated artists that a plain savefig would leave out."""
+        artists = self._artists()
+        for artist in artists:
+            artist.set_animated(False)
+        try:
+            self.fig.savefig(path, dpi=dpi)
+        finally:
+            for artist in artists:
+                artist.set_animated(True)
+            # Saving fires a draw event at the export resolution; cache a fresh background on the next frame
+            self._background = None
+
+    def run(self, figure_path: Optional[Union[str, Path]] = None, keep_open: bool = True) -> None:
+        """
+        Show the window and keep it updated until the acquisition finishes or the window is closed.
+
+        Args:
+            figure_path (str | Path, optional): Where to save the final frame once the acquisition ends.
+            keep_open (bool): If True and the acquisition ended first, block until the window is closed.
+        """
+        import matplotlib.pyplot as plt
+
+        plt.show(block=False)
+        while not self.acquisition.finished and plt.fignum_exists(self.fig.number):
+            started = time.monotonic()
+            self.update()
+            remaining = self.frame_interval_s - (time.monotonic() - started)
+            # Unlike plt.pause, this processes GUI events without forcing a full redraw
+            self.fig.canvas.start_event_loop(max(remaining, 1e-3))
+        if plt.fignum_exists(self.fig.number):
+            self.update()
+        else:
+            self._refresh()
+        if figure_path is not None:
+            self.save(figure_path)
+        if keep_open and plt.fignum_exists(self.fig.number):
+            plt.show(block=True)
+
+
+__all__ = ["LivePlot"]
@@ -0,0 +1,230 @@
+import codecs
+import numpy as np
+import os
+import time
+from pathlib import Path
+from typing import IO, Iterator, Optional, Sequence, Tuple, Union
+
+Sample = Tuple[float, float]
+
+
+class StreamSource:
+    """
+    Read samples line by line from a serial device, named pipe or pseudo-terminal.
+
+    Each line holds either "time value" or just "value" (whitespace, comma or tab
+    separated). In the latter case time is derived from the sample index and
+    `sample_frequency_hz`. Lines that do not parse, such as the logger's header, are skipped.
+
+    Reads wait at most `poll_interval_s`; whenever the logger stays quiet that long the
+    source yields None, so the acquisition can flush pending samples and notice a stop
+    request even though the stream is idle rather than closed.
+
+    Args:
+        stream: A path to open (e.g. "/dev/ttyUSB0" or a FIFO), or an already open stream.
+            Open streams with a file descriptor are read through it, bypassing their buffer.
+        sample_frequency_hz (float): Sampling frequency of the logger.
+        encoding (str): Encoding of the logger's output.
+        poll_interval_s (float): Longest time a read waits before yielding None.
+    """
+
+    def __init__(
+        self,
+        stream: Union[str, Path, IO[str]],
+        sample_frequency_hz: float = 9.0,
+        encoding: str = "utf-8",
+        poll_interval_s: float = 0.1,
+    ):
+        self.stream = stream
+        self.sample_frequency_hz = sample_frequency_hz
+        self.encoding = encoding
+        self.poll_interval_s = poll_interval_s
+
+    def __iter__(self) -> Iterator[Optional[Sample]]:
+        index = 0
+        for line in self._lines():
+            if line is None:
+                yield None
+                continue
+            sample = self._parse(line, index)
+            if sample is not None:
+                index += 1
+                yield sample
+
+    def _parse(self, line: str, index: int) -> Optional[Sample]:
+        fields = line.replace(",", " ").split()
+        try:
+            values = [float(field) for field in fields]
+        except ValueError:
+            return None
+        if len(values) == 1:
+            return index / self.sample_frequency_hz, values[0]
+        if len(values) >= 2:
+            return values[0], values[1]
+        return None
+
+    def _lines(self) -> Iterator[Optional[str]]:
+        if os.name == "nt":
+            # select() only works on sockets on Windows; fall back to blocking reads
+            if isinstance(self.stream, (str, Path)):
+                with open(self.stream, "r", encoding=self.encoding, errors="replace") as f:
+                    yield from f
+            else:
+                yield from self.stream
+            return
+
+        if isinstance(self.stream, (str, Path)):
+            fd = os.open(self.stream, os.O_RDONLY | getattr(os, "O_NOCTTY", 0))
+            try:
+                yield from self._split_lines(self._read_fd(fd))
+            finally:
+                os.close(fd)
+            return
+
+        try:
+            fd = self.stream.fileno()
+        except (AttributeError, OSError, ValueError):
+            # In-memory streams never block
+            yield from self.stream
+            return
+        yield from self._split_lines(self._read_fd(fd))
+
+    def _read_fd(self, fd: int) -> Iterator[Optional[bytes]]:
+        """Yield chunks of bytes, None when nothing arrived within the poll interval, and b"" at EOF."""
+        import errno
+        import select
+
+        while True:
+            ready, _, _ = select.select([fd], [], [], self.poll_interval_s)
+            if not ready:
+                yield None
+                continue
+            try:
+                chunk = os.read(fd, 4096)
+            except OSError as e:
+                # A pseudo-terminal reports EIO once the other side is closed
+                if e.errno != errno.EIO:
+                    raise
+                chunk = b""
+            yield chunk
+            if not chunk:
+                return
+
+    def _split_lines(self, chunks: Iterator[Optional[bytes]]) -> Iterator[Optional[str]]:
+        """Decode chunks into complete lines, passing the idle markers (None) through."""
+        decoder = codecs.getincrementaldecoder(self.encoding)(errors="replace")
+        pending = ""
+        for chunk in chunks:
+            if chunk is None:
+                yield None
+                continue
+            if not chunk:
+                break
+            pending += decoder.decode(chunk)
+            *lines, pending = pending.split("\n")
+            yield from lines
+        pending += decoder.decode(b"", final=True)
+        if pending:
+            yield pending
+
+
+class SerialSource(StreamSource):
+    """
+    Read samples from a serial port through pyserial, for loggers that need a baud rate set.
+
+    pyserial is optional; it is only imported when the source is iterated.
+
+    Args:
+        port (str): Serial port name, e.g. "/dev/ttyUSB0" or "COM3".
+        baudrate (int): Baud rate of the logger.
+        sample_frequency_hz (float): Sampling frequency of the logger.
+        encoding (str): Encoding of the logger's output.
+        poll_interval_s (float): Longest time a read waits before yielding None.
+    """
+
+    def __init__(
+        self,
+        port: str,
+        baudrate: int = 9600,
+        sample_frequency_hz: float = 9.0,
+        encoding: str = "utf-8",
+        poll_interval_s: float = 0.1,
+    ):
+        super().__init__(port, sample_frequency_hz, encoding, poll_interval_s)
+        self.baudrate = baudrate
+
+    def _lines(self) -> Iterator[Optional[str]]:
+        try:
+            import serial
+        except ImportError as e:
+            raise ImportError("Reading from a serial port requires pyserial: uv pip install pyserial") from e
+
+        def chunks(port) -> Iterator[Optional[bytes]]:
+            while True:
+                # Returns early with whatever arrived once the read timeout passes
+                yield port.read(max(port.in_waiting, 1)) or None
+
+        with serial.Serial(str(self.stream), self.baudrate, timeout=self.poll_interval_s) as port:
+            yield from self._split_lines(chunks(port))
+
+
+class SimulatedSource:
+    """
+    Generate a weighing-voltage trace like the one logged in 实验2-2, in real time.
+
+    The voltage falls linearly as the nitrogen evaporates, and drops by `drops[i]`
+    at `drop_times[i]` when a copper block is put in, with Gaussian noise on top.
+
+    Args:
+        sample_frequency_hz (float): Sampling frequency.
+        duration_s (float): Length of the trace in seconds.
+        start_voltage (float): Initial voltage in V.
+        rate (float): Evaporation slope in V/s (negative).
+        drop_times (Sequence[float]): Times of the voltage drops in seconds.
+        drops (Sequence[float]): Sizes of the voltage drops in V.
+        noise (float): Standard deviation of the noise in V.
+        realtime (bool): If True, sleep between samples to mimic the logger's pace.
+        seed (int): Seed of the noise generator.
+    """
+
+    def __init__(
+        self,
+        sample_frequency_hz: float = 9.0,
+        duration_s: float = 1000.0,
+        start_voltage: float = 3.2e-4,
+        rate: float = -3.0e-8,
+        drop_times: Sequence[float] = (500.0, 735.0),
+        drops: Sequence[float] = (4.0e-6, 4.5e-6),
+        noise: float = 2.0e-7,
+        realtime: bool = True,
+        seed: Optional[int] = 0,
+    ):
+        self.sample_frequency_hz = sample_frequency_hz
+        self.duration_s = duration_s
+        self.start_voltage = start_voltage
+        self.rate = rate
+        self.drop_times = np.asarray(drop_times, dtype=float)
+        self.drops = np.asarray(drops, dtype=float)
+        self.noise = noise
+        self.realtime = realtime
+        self.seed = seed
+
+    def __iter__(self) -> Iterator[Sample]:
+        rng = np.random.default_rng(self.seed)
+        count = int(self.duration_s * self.sample_frequency_hz)
+        t = np.arange(count) / self.sample_frequency_hz
+        u = self.start_voltage + self.rate * t + rng.normal(0.0, self.noise, count)
+        for when, drop in zip(self.drop_times, self.drops):
+            u[t >= when] -= drop
+
+        period = 1 / self.sample_frequency_hz
+        started = time.monotonic()
+        for i in range(count):
+            if self.realtime:
+                delay = started + i * period - time.monotonic()
+                if delay > 0:
+                    time.sleep(delay)
+            yield float(t[i]), float(u[i])
+
+
+__all__ = ["StreamSource", "SerialSource", "SimulatedSource"]
@@ -0,0 +1,15 @@
+from . import tables  # noqa: F401
+from .heat import HeatCapacity, copper, debye_heat_capacity, debye_energy
+from .sensors import pt100_resistance, pt100_temperature, ntc_resistance, ntc_temperature
+
+__all__ = [
+    "tables",
+    "HeatCapacity",
+    "copper",
+    "debye_heat_capacity",
+    "debye_energy",
+    "pt100_resistance",
+    "pt100_temperature",
+    "ntc_resistance",
+    "ntc_temperature",
+]
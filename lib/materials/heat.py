@@ -0,0 +1,146 @@
+import numpy as np
+from functools import cache
+from scipy.integrate import cumulative_trapezoid
+from scipy.interpolate import CubicSpline
+from typing import Tuple
+
+from .tables import (
+    COPPER_CP,
+    COPPER_CP_TEMPERATURE,
+    COPPER_DEBYE_TEMPERATURE,
+    COPPER_MOLAR_MASS,
+    GAS_CONSTANT,
+)
+
+_DEBYE_X_MAX = 60.0
+_DEBYE_X_STEP = 1e-3
+
+
+@cache
+def _debye_table() -> Tuple[np.ndarray, np.ndarray]:
+    """Tabulate I(x) = ∫₀ˣ t³/(eᵗ-1) dt once; every Debye evaluation interpolates this table."""
+    x = np.arange(0.0, _DEBYE_X_MAX + _DEBYE_X_STEP, _DEBYE_X_STEP)
+    integrand = np.empty_like(x)
+    integrand[0] = 0.0
+    integrand[1:] = x[1:] ** 3 / np.expm1(x[1:])
+    return x, cumulative_trapezoid(integrand, x, initial=0.0)
+
+
+def _debye_integral(x: np.ndarray) -> np.ndarray:
+    grid, table = _debye_table()
+    # Beyond the table the integral has converged to π⁴/15
+    return np.interp(x, grid, table, right=np.pi**4 / 15)
+
+
+def debye_heat_capacity(temperature, debye_temperature: float, molar_mass: float):
+    """
+    Specific heat capacity predicted by the Debye model.
+
+    Args:
+        temperature (float | np.ndarray): Temperature in K.
+        debye_temperature (float): Debye temperature of the solid in K.
+        molar_mass (float): Molar mass in kg/mol.
+
+    Returns:
+        Cp in J·kg⁻¹·K⁻¹, with the same shape as `temperature`.
+    """
+
+    t = np.maximum(np.asarray(temperature, dtype=float), 1e-9)
+    x = np.maximum(debye_temperature / t, 1e-9)
+    d3 = 3 * _debye_integral(x) / x**3
+    return 3 * GAS_CONSTANT / molar_mass * (4 * d3 - 3 * x / np.expm1(np.minimum(x, 700.0)))
+
+
+def debye_energy(temperature, debye_temperature: float, molar_mass: float):
+    """
+    Thermal energy per unit mass predicted by the Debye model, i.e. ∫₀ᵀ Cp dT.
+
+    Args:
+        temperature (float | np.ndarray): Temperature in K.
+        debye_temperature (float): Debye temperature of the solid in K.
+        molar_mass (float): Molar mass in kg/mol.
+
+    Returns:
+        Energy in J·kg⁻¹, with the same shape as `temperature`.
+    """
+
+    t = np.maximum(np.asarray(temperature, dtype=float), 1e-9)
+    x = debye_temperature / t
+    return 9 * GAS_CONSTANT / molar_mass * t * _debye_integral(x) / x**3
+
+
+class HeatCapacity:
+    """
+    Specific heat capacity Cp(T) of a solid, built from a reference table.
+
+    Inside the table, Cp is a cubic spline through the reference points, and ∫Cp dT
+    is its exact antiderivative. Outside the table, the Debye model is used, scaled
+    to meet the spline at the table's edges. Everything is built once at construction,
+    so evaluating Cp or ∫Cp dT costs a lookup per temperature.
+
+    Args:
+        temperature (np.ndarray): Reference temperatures in K, increasing.
+        cp (np.ndarray): Reference Cp values in J·kg⁻¹·K⁻¹.
+        debye_temperature (float): Debye temperature in K, used outside the table.
+        molar_mass (float): Molar mass in kg/mol, used outside the table.
+    """
+
+    def __init__(self, temperature: np.ndarray, cp: np.ndarray, debye_temperature: float, molar_mass: float):
+        self.temperature = np.asarray(temperature, dtype=float)
+        self.cp = np.asarray(cp, dtype=float)
+        self.debye_temperature = debye_temperature
+        self.molar_mass = molar_mass
+
+        self._spline = CubicSpline(self.temperature, self.cp, bc_type="natural")
+        self._antiderivative = self._spline.antiderivative()
+        self._t_lo, self._t_hi = self.temperature[0], self.temperature[-1]
+        self._scale_lo = self.cp[0] / debye_heat_capacity(self._t_lo, debye_temperature, molar_mass)
+        self._scale_hi = self.cp[-1] / debye_heat_capacity(self._t_hi, debye_temperature, molar_mass)
+        self._energy_lo = debye_energy(self._t_lo, debye_temperature, molar_mass)
+        self._energy_hi = debye_energy(self._t_hi, debye_temperature, molar_mass)
+        self._f_lo = self._antiderivative(self._t_lo)
+        self._f_hi = self._antiderivative(self._t_hi)
+
+    def __call__(self, temperature):
+        """Evaluate Cp at the given temperature(s) in K."""
+        t = np.asarray(temperature, dtype=float)
+        inside = self._spline(np.clip(t, self._t_lo, self._t_hi))
+        outside = debye_heat_capacity(t, self.debye_temperature, self.molar_mass)
+        result = np.where(
+            t < self._t_lo, self._scale_lo * outside,
+            np.where(t > self._t_hi, self._scale_hi * outside, inside),
+        )
+        return result if result.ndim else float(result)
+
+    def cumulative(self, temperature):
+        """
+        The running integral F(T) = ∫ Cp dT, measured from the lowest table temperature.
+
+        Differences of F give ∫Cp dT between any two temperatures.
+        """
+
+        t = np.asarray(temperature, dtype=float)
+        inside = self._antiderivative(np.clip(t, self._t_lo, self._t_hi)) - self._f_lo
+        energy = debye_energy(t, self.debye_temperature, self.molar_mass)
+        below = self._scale_lo * (energy - self._energy_lo)
+        above = (self._f_hi - self._f_lo) + self._scale_hi * (energy - self._energy_hi)
+        result = np.where(t < self._t_lo, below, np.where(t > self._t_hi, above, inside))
+        return result if result.ndim else float(result)
+
+    def integral(self, t_from, t_to):
+        """
+        Heat per unit mass needed to warm the solid from `t_from` to `t_to`, ∫ Cp dT in J·kg⁻¹.
+
+        Both arguments may be arrays; they are broadcast against each other.
+        """
+
+        return self.cumulative(t_to) - self.cumulative(t_from)
+
+
+@cache
+def copper() -> HeatCapacity:
+    """The Cp(T) of copper, built from the reference table on first use and cached afterwards."""
+    return HeatCapacity(COPPER_CP_TEMPERATURE, COPPER_CP, COPPER_DEBYE_TEMPERATURE, COPPER_MOLAR_MASS)
+
+
+__all__ = ["HeatCapacity", "copper", "debye_heat_capacity", "debye_energy"]
@@ -0,0 +1,102 @@
+import numpy as np
+
+from .tables import NTC_PRESETS, NTC_T25, PT100_A, PT100_B, PT100_C, PT100_R0
+
+
+def pt100_resistance(temperature, r0: float = PT100_R0):
+    """
+    Resistance of a platinum resistance thermometer, by the Callendar-Van Dusen equation.
+
+    Args:
+        temperature (float | np.ndarray): Temperature in °C.
+        r0 (float): Resistance at 0 °C in ohm.
+
+    Returns:
+        Resistance in ohm, with the same shape as `temperature`.
+    """
+
+    t = np.asarray(temperature, dtype=float)
+    # The cubic correction only applies below 0 °C
+    c = np.where(t < 0, PT100_C, 0.0)
+    result = r0 * (1 + PT100_A * t + PT100_B * t**2 + c * (t - 100) * t**3)
+    return result if result.ndim else float(result)
+
+
+def pt100_temperature(resistance, r0: float = PT100_R0):
+    """
+    Temperature of a platinum resistance thermometer from its resistance.
+
+    Solves the Callendar-Van Dusen quadratic in closed form, which is exact at and
+    above 0 °C. Below 0 °C the cubic term is added back with a few Newton steps on
+    the full equation, starting from the quadratic solution.
+
+    Args:
+        resistance (float | np.ndarray): Resistance in ohm.
+        r0 (float): Resistance at 0 °C in ohm.
+
+    Returns:
+        Temperature in °C, with the same shape as `resistance`.
+    """
+
+    ratio = np.asarray(resistance, dtype=float) / r0
+    t = (-PT100_A + np.sqrt(PT100_A**2 - 4 * PT100_B * (1 - ratio))) / (2 * PT100_B)
+    # The quadratic is off by 0.02 °C at -50 °C and 0.2 °C at -100 °C; Newton converges in a few steps
+    c = np.where(t < 0, PT100_C, 0.0)
+    for _ in range(4):
+        f = 1 + PT100_A * t + PT100_B * t**2 + c * (t - 100) * t**3 - ratio
+        df = PT100_A + 2 * PT100_B * t + c * (4 * t**3 - 300 * t**2)
+        t = t - f / df
+    return t if t.ndim else float(t)
+
+
+def _ntc_parameters(preset: str | None, r25: float | None, b: float | None) -> tuple[float, float]:
+    if preset is not None:
+        if preset not in NTC_PRESETS:
+            raise KeyError(f"Unknown NTC preset {preset!r}. Available: {', '.join(NTC_PRESETS)}")
+        preset_r25, preset_b = NTC_PRESETS[preset]
+        r25 = preset_r25 if r25 is None else r25
+        b = preset_b if b is None else b
+    if r25 is None or b is None:
+        raise ValueError("Either a preset or both r25 and b must be given.")
+    return r25, b
+
+
+def ntc_resistance(temperature, preset: str | None = None, r25: float | None = None, b: float | None = None):
+    """
+    Resistance of an NTC thermistor by the B-parameter equation R = R25 · exp(B (1/T - 1/T25)).
+
+    Args:
+        temperature (float | np.ndarray): Temperature in K.
+        preset (str, optional): A key of `NTC_PRESETS`, e.g. "10k-3950".
+        r25 (float, optional): Resistance at 25 °C in ohm. Overrides the preset.
+        b (float, optional): B-value in K. Overrides the preset.
+
+    Returns:
+        Resistance in ohm, with the same shape as `temperature`.
+    """
+
+    r25, b = _ntc_parameters(preset, r25, b)
+    result = r25 * np.exp(b * (1 / np.asarray(temperature, dtype=float) - 1 / NTC_T25))
+    return result if result.ndim else float(result)
+
+
+def ntc_temperature(resistance, preset: str | None = None, r25: float | None = None, b: float | None = None):
+    """
+    Temperature of an NTC thermistor from its resistance, inverting `ntc_resistance`.
+
+    Args:
+        resistance (float | np.ndarray): Resistance in ohm.
+        preset (str, optional): A key of `NTC_PRESETS`, e.g. "10k-3950".
+        r25 (float, optional): Resistance at 25 °C in ohm. Overrides the preset.
+        b (float, optional): B-value in K. Overrides the preset.
+
+    Returns:
+        Temperature in K, with the same shape as `resistance`.
+    """
+
+    r25, b = _ntc_parameters(preset, r25, b)
+    result = 1 / (1 / NTC_T25 + np.log(np.asarray(resistance, dtype=float) / r25) / b)
+    return result if result.ndim else float(result)
+
+
+__all__ = ["pt100_resistance", "pt100_temperature", "ntc_resistance", "ntc_temperature"]
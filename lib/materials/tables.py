@@ -0,0 +1,41 @@
+# Reference data used across the experiments. All values are in SI units unless noted otherwise.
+
+import numpy as np
+
+# Specific heat capacity of copper at constant pressure, as used in 实验2-2
+COPPER_CP_TEMPERATURE = np.array([
+    70, 80, 90, 100, 110, 120, 130, 140, 150, 160, 170, 180,
+    190, 200, 210, 220, 230, 240, 250, 260, 270, 280, 290, 300
+], dtype=float)  # unit: K
+COPPER_CP = np.array([
+    171.5, 202.7, 229.5, 252.2, 271.2, 287.2, 300.7, 312.2, 322.0, 330.6, 338.0, 344.5,
+    350.0, 355.0, 359.4, 363.5, 367.1, 370.2, 373.1, 375.8, 378.3, 380.7, 382.9, 384.8
+], dtype=float)  # unit: J/(kg·K)
+COPPER_MOLAR_MASS = 63.546e-3  # unit: kg/mol
+COPPER_DEBYE_TEMPERATURE = 343.5  # unit: K
+
+# Boiling point of liquid nitrogen at standard pressure
+LIQUID_NITROGEN_TEMPERATURE = 77.0  # unit: K
+
+# Callendar-Van Dusen coefficients of IEC 60751 platinum resistance thermometers (Pt-100)
+PT100_R0 = 100.0  # unit: ohm
+PT100_A = 3.9083e-3  # unit: 1/°C
+PT100_B = -5.775e-7  # unit: 1/°C^2
+PT100_C = -4.183e-12  # unit: 1/°C^4, only used below 0 °C
+
+# Common NTC thermistors, as (R25 in ohm, B-value in K)
+NTC_PRESETS = {
+    "10k-3950": (10000.0, 3950.0),
+    "10k-3435": (10000.0, 3435.0),
+    "5k-3470": (5000.0, 3470.0),
+    "100k-3950": (100000.0, 3950.0),
+}
+NTC_T25 = 298.15  # unit: K
+
+# Sodium D lines, as used in 实验2-4
+SODIUM_D1_NM = 589.5924  # unit: nm
+SODIUM_D2_NM = 588.9950  # unit: nm
+SODIUM_D_MEAN_NM = 589.3  # unit: nm
+SODIUM_D_SPLIT_NM = SODIUM_D1_NM - SODIUM_D2_NM  # unit: nm
+
+GAS_CONSTANT = 8.314462618  # unit: J/(mol·K)
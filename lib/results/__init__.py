@@ -0,0 +1,17 @@
+from .store import Column, connect, record, merge, load, experiments
+from .analysis import Summary, Comparison, summarize, robust_z_scores, outliers, compare
+
+__all__ = [
+    "Column",
+    "connect",
+    "record",
+    "merge",
+    "load",
+    "experiments",
+    "Summary",
+    "Comparison",
+    "summarize",
+    "robust_z_scores",
+    "outliers",
+    "compare",
+]
@@ -0,0 +1,78 @@
+import argparse
+from rich.console import Console
+from rich.rule import Rule
+from rich.table import Table
+from rich import box
+
+from .analysis import compare, outliers, summarize
+from .store import experiments, load, merge
+
+
+def report_experiment(console: Console, experiment: str, args: argparse.Namespace) -> None:
+    columns = load(experiment, class_name=args.class_name, db_path=args.db)
+    console.print(Rule(title=f"[bold green]📊 Experiment {experiment}[/bold green]"))
+    if not columns:
+        console.print("[yellow]No results recorded yet.[/yellow]")
+        console.print("")
+        return
+
+    table = Table(title="Class distribution", title_style="bold", box=box.ROUNDED)
+    for header in ("Quantity", "Unit", "N", "Mean", "Std", "Min", "Median", "Max", "Outliers"):
+        table.add_column(header, justify="left" if header in ("Quantity", "Unit") else "right")
+    flagged = {}
+    for column in columns.values():
+        s = summarize(column)
+        mask = outliers(column, args.threshold)
+        if mask.any():
+            flagged[column.name] = column.student_id[mask]
+        table.add_row(
+            s.name, s.unit or "", str(s.count),
+            f"{s.mean:.4g}", f"{s.std:.2g}", f"{s.min:.4g}", f"{s.median:.4g}", f"{s.max:.4g}",
+            str(int(mask.sum())),
+        )
+    console.print(table)
+    for name, student_ids in flagged.items():
+        console.print(f"[bold red]⚠️  Outliers in {name}:[/bold red] " + ", ".join(str(i) for i in student_ids))
+
+    if args.student is not None:
+        table = Table(title=f"Student {args.student} vs. class", title_style="bold", box=box.ROUNDED)
+        for header in ("Quantity", "Value", "Class Median", "Percentile", "Robust z"):
+            table.add_column(header, justify="left" if header == "Quantity" else "right")
+        for column in columns.values():
+            c = compare(column, args.student, args.threshold)
+            if c is None:
+                continue
+            style = "bold red" if c.outlier else None
+            table.add_row(
+                c.name, f"{c.value:.4g}", f"{c.median:.4g}", f"{c.percentile:.0f} %", f"{c.z_score:+.2f}",
+                style=style,
+            )
+        console.print(table)
+    console.print("")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="SJPHY - Class-wide report of recorded experiment results")
+    parser.add_argument("--experiment", help="Experiment key, e.g. 2-2. Defaults to all experiments")
+    parser.add_argument("--class", dest="class_name", help="Only include students of this class")
+    parser.add_argument("--student", type=int, help="Student ID to compare against the class. Defaults to me.yaml")
+    parser.add_argument("--threshold", type=float, default=3.5, help="Robust z-score above which a result is an outlier")
+    parser.add_argument("--db", help="Path to the results database")
+    parser.add_argument(
+        "--import", dest="sources", nargs="+", metavar="DB", default=[],
+        help="Merge these results databases (e.g. collected from every student) into --db before reporting",
+    )
+    args = parser.parse_args()
+
+    if args.student is None:
+        import me
+
+        if me.exists() and me.valid():
+            args.student = me.get_id()
+
+    console = Console()
+    if args.sources:
+        imported = merge(*args.sources, db_path=args.db)
+        console.print(f"[green]✅ Imported {imported} run(s) from {len(args.sources)} database(s)[/green]")
+    for experiment in [args.experiment] if args.experiment else experiments(args.db):
+        report_experiment(console, experiment, args)
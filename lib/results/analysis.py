@@ -0,0 +1,106 @@
+import numpy as np
+from dataclasses import dataclass
+from typing import Optional
+
+from .store import Column
+
+# Scales the median absolute deviation to the standard deviation of a normal distribution
+MAD_SCALE = 0.6745
+
+
+@dataclass
+class Summary:
+    """Distribution of one quantity over the class."""
+    name: str
+    unit: Optional[str]
+    count: int
+    mean: float
+    std: float
+    min: float
+    q1: float
+    median: float
+    q3: float
+    max: float
+
+
+@dataclass
+class Comparison:
+    """How one student's result sits within the class distribution."""
+    name: str
+    unit: Optional[str]
+    value: float
+    median: float
+    percentile: float
+    z_score: float
+    outlier: bool
+
+
+def summarize(column: Column) -> Summary:
+    """Compute the class distribution of a quantity."""
+    values = column.value
+    q1, median, q3 = np.percentile(values, [25, 50, 75])
+    return Summary(
+        name=column.name,
+        unit=column.unit,
+        count=int(values.size),
+        mean=float(values.mean()),
+        std=float(values.std(ddof=1)) if values.size > 1 else 0.0,
+        min=float(values[0]),
+        q1=float(q1),
+        median=float(median),
+        q3=float(q3),
+        max=float(values[-1]),
+    )
+
+
+def robust_z_scores(column: Column) -> np.ndarray:
+    """
+    Robust z-score of every value, based on the median and the median absolute deviation.
+
+    Unlike the usual z-score, a few wildly wrong results do not inflate the spread
+    and hide themselves.
+    """
+
+    values = column.value
+    median = np.median(values)
+    mad = np.median(np.abs(values - median))
+    if mad == 0:
+        std = values.std()
+        return np.zeros_like(values) if std == 0 else (values - values.mean()) / std
+    return MAD_SCALE * (values - median) / mad
+
+
+def outliers(column: Column, threshold: float = 3.5) -> np.ndarray:
+    """Boolean mask of the values whose robust z-score exceeds `threshold` in magnitude."""
+    return np.abs(robust_z_scores(column)) > threshold
+
+
+def compare(column: Column, student_id: int, threshold: float = 3.5) -> Optional[Comparison]:
+    """
+    Compare a student's result with the rest of the class.
+
+    Returns:
+        The Comparison, or None if the student has no result for this quantity.
+    """
+
+    matches = np.flatnonzero(column.student_id == student_id)
+    if matches.size == 0:
+        return None
+    index = matches[0]
+    value = column.value[index]
+    z_scores = robust_z_scores(column)
+    # Values are sorted, so the rank is a binary search
+    below = np.searchsorted(column.value, value, side="left")
+    equal = np.searchsorted(column.value, value, side="right") - below
+    return Comparison(
+        name=column.name,
+        unit=column.unit,
+        value=float(value),
+        median=float(np.median(column.value)),
+        percentile=float(100 * (below + 0.5 * equal) / column.value.size),
+        z_score=float(z_scores[index]),
+        outlier=bool(abs(z_scores[index]) > threshold),
+    )
+
+
+__all__ = ["Summary", "Comparison", "summarize", "robust_z_scores", "outliers", "compare"]
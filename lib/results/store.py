@@ -0,0 +1,302 @@
+import sqlite3
+import numpy as np
+from contextlib import contextmanager
+from dataclasses import dataclass
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Iterator, Mapping, Optional, Union, TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from me import Student
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS runs (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    experiment TEXT NOT NULL,
+    student_id INTEGER NOT NULL,
+    student_name TEXT,
+    class_name TEXT,
+    date TEXT,
+    recorded_at TEXT NOT NULL,
+    source TEXT,
+    revision TEXT
+);
+CREATE TABLE IF NOT EXISTS results (
+    run_id INTEGER NOT NULL REFERENCES runs(id) ON DELETE CASCADE,
+    name TEXT NOT NULL,
+    value REAL NOT NULL,
+    uncertainty REAL,
+    unit TEXT,
+    PRIMARY KEY (run_id, name)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS runs_by_experiment ON runs(experiment, student_id, recorded_at);
+CREATE INDEX IF NOT EXISTS runs_by_class ON runs(class_name, experiment);
+CREATE INDEX IF NOT EXISTS results_by_name ON results(name, run_id);
+"""
+
+ValueLike = Union[float, int, tuple, Any]
+
+
+@dataclass
+class Column:
+    """
+    All class results of one quantity, as parallel arrays (one entry per student).
+
+    Only each student's most recently recorded run of the experiment is included, and the
+    arrays are sorted by value, so order statistics need no further sorting.
+    """
+    name: str
+    unit: Optional[str]
+    student_id: np.ndarray
+    class_name: np.ndarray
+    value: np.ndarray
+    uncertainty: np.ndarray
+
+
+def _get_db_path() -> Path:
+    """Get the path to the results database, next to me.yaml at the project root."""
+    import os
+
+    # /lib/results/store.py
+    project_root = Path(os.path.dirname(os.path.abspath(__file__))).parent.parent
+    return project_root / "results.db"
+
+
+def connect(db_path: Optional[Union[str, Path]] = None) -> sqlite3.Connection:
+    """Open the results database, creating the tables and indexes on first use."""
+    connection = sqlite3.connect(str(db_path or _get_db_path()))
+    connection.execute("PRAGMA foreign_keys = ON")
+    connection.executescript(SCHEMA)
+    return connection
+
+
+@contextmanager
+def _session(db_path: Optional[Union[str, Path]]) -> Iterator[sqlite3.Connection]:
+    """Open the database for one transaction, committing on success and always closing."""
+    connection = connect(db_path)
+    try:
+        with connection:
+            yield connection
+    finally:
+        connection.close()
+
+
+def _split_value(value: ValueLike) -> tuple[float, Optional[float]]:
+    """Accept a plain number, a (value, uncertainty) pair, or an `uncertainties` ufloat."""
+    if hasattr(value, "nominal_value"):
+        return float(value.nominal_value), float(value.std_dev)
+    if isinstance(value, tuple):
+        return float(value[0]), float(value[1])
+    return float(value), None
+
+
+def _finite_values(values: Mapping[str, ValueLike]) -> dict[str, tuple[float, Optional[float]]]:
+    """Split every value, leaving out those that are not finite numbers (e.g. from a failed fit)."""
+    from rich import print
+
+    finite = {}
+    for name, value in values.items():
+        nominal, uncertainty = _split_value(value)
+        if not np.isfinite(nominal):
+            print(f"[yellow]⚠️  Not recording {name}: {nominal} is not a finite number.[/yellow]")
+            continue
+        if uncertainty is not None and not np.isfinite(uncertainty):
+            uncertainty = None
+        finite[name] = (nominal, uncertainty)
+    return finite
+
+
+def _git_revision() -> Optional[str]:
+    import subprocess
+
+    try:
+        output = subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            cwd=_get_db_path().parent, capture_output=True, text=True, timeout=5,
+        )
+    except (OSError, subprocess.SubprocessError):
+        return None
+    return output.stdout.strip() or None
+
+
+def record(
+    experiment: str,
+    values: Mapping[str, ValueLike],
+    date: Optional[str] = None,
+    units: Optional[Mapping[str, str]] = None,
+    db_path: Optional[Union[str, Path]] = None,
+    student: Optional["Student"] = None,
+) -> int:
+    """
+    Append the results of one experiment run to the results database.
+
+    The working directory (normally the experiment folder) and the current git revision
+    are stored alongside as provenance. Values that are not finite numbers, such as the
+    NaN of a failed fit, are left out with a warning.
+
+    Args:
+        experiment (str): Experiment key, e.g. "2-2".
+        values (dict): Result values by name. Each value may be a number, a
+            (value, uncertainty) tuple or a ufloat.
+        date (str, optional): Date the experiment was conducted.
+        units (dict, optional): Units by result name.
+        db_path (str | Path, optional): Database file. Defaults to results.db at the project root.
+        student (me.Student, optional): The student the results belong to. Defaults to the one in me.yaml.
+
+    Returns:
+        The id of the new run.
+    """
+
+    import os
+
+    if student is None:
+        import me
+
+        student = me.get()
+    finite = _finite_values(values)
+    units = units or {}
+    with _session(db_path) as connection:
+        cursor = connection.execute(
+            "INSERT INTO runs (experiment, student_id, student_name, class_name, date, recorded_at, source, revision) "
+            "VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+            (
+                experiment,
+                student["student_id"],
+                student["student_name"],
+                student["class_name"],
+                date,
+                datetime.now().isoformat(timespec="microseconds"),
+                os.getcwd(),
+                _git_revision(),
+            ),
+        )
+        run_id = cursor.lastrowid
+        assert run_id is not None
+        connection.executemany(
+            "INSERT INTO results (run_id, name, value, uncertainty, unit) VALUES (?, ?, ?, ?, ?)",
+            [(run_id, name, value, uncertainty, units.get(name)) for name, (value, uncertainty) in finite.items()],
+        )
+    return run_id
+
+
+def merge(*sources: Union[str, Path], db_path: Optional[Union[str, Path]] = None) -> int:
+    """
+    Import the runs of other results databases, e.g. the results.db files collected from a class.
+
+    Runs that are already present (same experiment, student, recording time and source)
+    are skipped, so merging the same file twice has no effect.
+
+    Args:
+        *sources (str | Path): Database files to import from. They are opened read-only.
+        db_path (str | Path, optional): Database file to import into.
+
+    Returns:
+        The number of runs imported.
+    """
+
+    imported = 0
+    with _session(db_path) as connection:
+        for source in sources:
+            path = Path(source)
+            if not path.is_file():
+                raise FileNotFoundError(f"Results database not found: {path}")
+            other = sqlite3.connect(f"{path.resolve().as_uri()}?mode=ro", uri=True)
+            try:
+                runs = other.execute(
+                    "SELECT id, experiment, student_id, student_name, class_name, date, recorded_at, source, revision "
+                    "FROM runs ORDER BY id"
+                ).fetchall()
+                for run_id, *run in runs:
+                    experiment, student_id, _, _, _, recorded_at, run_source, _ = run
+                    if connection.execute(
+                        "SELECT 1 FROM runs WHERE experiment = ? AND student_id = ? AND recorded_at = ? AND source IS ?",
+                        (experiment, student_id, recorded_at, run_source),
+                    ).fetchone():
+                        continue
+                    cursor = connection.execute(
+                        "INSERT INTO runs (experiment, student_id, student_name, class_name, date, recorded_at, source, revision) "
+                        "VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                        run,
+                    )
+                    connection.executemany(
+                        "INSERT INTO results (run_id, name, value, uncertainty, unit) VALUES (?, ?, ?, ?, ?)",
+                        [
+                            (cursor.lastrowid, *row)
+                            for row in other.execute(
+                                "SELECT name, value, uncertainty, unit FROM results WHERE run_id = ?", (run_id,)
+                            )
+                        ],
+                    )
+                    imported += 1
+            finally:
+                other.close()
+    return imported
+
+
+def load(
+    experiment: str,
+    class_name: Optional[str] = None,
+    db_path: Optional[Union[str, Path]] = None,
+) -> dict[str, Column]:
+    """
+    Load every quantity recorded for an experiment, keeping each student's latest run.
+
+    Runs are ordered by the time they were recorded, so a run merged in from another
+    database only replaces a student's local run if it is more recent.
+
+    Args:
+        experiment (str): Experiment key, e.g. "2-2".
+        class_name (str, optional): Only include students of this class.
+        db_path (str | Path, optional): Database file.
+
+    Returns:
+        A Column per quantity name.
+    """
+
+    query = """
+        WITH ranked AS (
+            SELECT id, ROW_NUMBER() OVER (PARTITION BY student_id ORDER BY recorded_at DESC, id DESC) AS rank
+            FROM runs
+            WHERE experiment = ? AND (? IS NULL OR class_name = ?)
+        ),
+        latest AS (SELECT id FROM ranked WHERE rank = 1)
+        SELECT r.name, r.unit, runs.student_id, runs.class_name, r.value, r.uncertainty
+        FROM latest
+        JOIN runs ON runs.id = latest.id
+        JOIN results r ON r.run_id = latest.id
+        ORDER BY r.name, r.value
+    """
+    with _session(db_path) as connection:
+        rows = connection.execute(query, (experiment, class_name, class_name)).fetchall()
+
+    if not rows:
+        return {}
+    names, units, student_ids, classes, values, uncertainties = zip(*rows)
+    names = np.array(names)
+    # Rows are sorted by name, so every quantity is one contiguous slice
+    _, starts = np.unique(names, return_index=True)
+    bounds = list(starts) + [len(names)]
+    student_ids = np.array(student_ids, dtype=np.int64)
+    classes = np.array(classes, dtype=object)
+    values = np.array(values, dtype=np.float64)
+    uncertainties = np.array([np.nan if u is None else u for u in uncertainties], dtype=np.float64)
+    return {
+        str(names[lo]): Column(
+            name=str(names[lo]),
+            unit=units[lo],
+            student_id=student_ids[lo:hi],
+            class_name=classes[lo:hi],
+            value=values[lo:hi],
+            uncertainty=uncertainties[lo:hi],
+        )
+        for lo, hi in zip(bounds[:-1], bounds[1:])
+    }
+
+
+def experiments(db_path: Optional[Union[str, Path]] = None) -> list[str]:
+    """List the experiment keys that have recorded runs."""
+    with _session(db_path) as connection:
+        return [row[0] for row in connection.execute("SELECT DISTINCT experiment FROM runs ORDER BY experiment")]
+
+
+__all__ = ["Column", "connect", "record", "merge", "load", "experiments"]
@@ -1,86 +1,223 @@
-from rich.console import Console
+import sys
+from rich.console import Console, RenderableType
+from rich.segment import Segments
 from rich.text import Text, TextType
-from richer.utils import getKey, hideCursor, removeLines, KEY_CODE
+from richer.utils import getKey, hideCursor, rawMode, removeLines, KEY_CODE
 from typing import List, Optional
 
 
+class _LiveBlock:
+    """
+    A block of terminal lines that is repainted in place.
+
+    The block is printed once; afterwards only the lines whose content changed are
+    rewritten, by moving the cursor up to them and back down again. The cursor rests
+    on the line right below the block between updates.
+    """
+
+    def __init__(self, console: Console):
+        self.console = console
+        self.lines: List[str] = []
+
+    def _to_ansi(self, renderable: RenderableType) -> List[str]:
+        """Render to one ANSI string per terminal line, cropped to the console width."""
+        rendered = self.console.render_lines(renderable, self.console.options, pad=False)
+        ansi = []
+        for line in rendered:
+            with self.console.capture() as capture:
+                self.console.print(Segments(line), end="")
+            ansi.append(capture.get())
+        return ansi
+
+    def update(self, renderables: List[RenderableType]) -> None:
+        """Show the given renderables, repainting only the lines that differ from the screen."""
+        new_lines = [line for renderable in renderables for line in self._to_ansi(renderable)]
+        if len(new_lines) != len(self.lines):
+            # The height changed (or this is the first paint): redraw the whole block
+            self.clear()
+            sys.stdout.write("".join(line + "\n" for line in new_lines))
+        else:
+            height = len(self.lines)
+            out = []
+            for i, (old, new) in enumerate(zip(self.lines, new_lines)):
+                if old != new:
+                    distance = height - i
+                    out.append(f"\x1b[{distance}F\x1b[2K{new}\x1b[{distance}E")
+            sys.stdout.write("".join(out))
+        sys.stdout.flush()
+        self.lines = new_lines
+
+    def clear(self) -> None:
+        """Remove the block from the screen."""
+        if self.lines:
+            removeLines(len(self.lines))
+            sys.stdout.flush()
+        self.lines = []
+
+
+class _OptionIndex:
+    """
+    Case-insensitive substring filter over a fixed list of options.
+
+    The folded option strings are built once. Typing a character only narrows the
+    previous matches, and each backspace restores the matches saved for the shorter
+    query, so a keystroke costs O(current matches) rather than O(all options).
+    """
+
+    def __init__(self, options: List[str]):
+        self._folded = [option.casefold() for option in options]
+        self._stack: List[List[int]] = [list(range(len(options)))]
+        self.query = ""
+
+    @property
+    def matches(self) -> List[int]:
+        return self._stack[-1]
+
+    def push(self, char: str) -> None:
+        self.query += char
+        needle = self.query.casefold()
+        self._stack.append([i for i in self._stack[-1] if needle in self._folded[i]])
+
+    def pop(self) -> None:
+        if self.query:
+            self.query = self.query[:-1]
+            self._stack.pop()
+
+    def reset(self) -> None:
+        del self._stack[1:]
+        self.query = ""
+
+
 def select(
     prompt: str,
     options: List[str],
     default_index: int = 0,
-    show_cursor: bool = True
+    show_cursor: bool = True,
+    max_visible: Optional[int] = None,
 ) -> int:
     """
     Display a keyboard-driven selector for the user to choose from a list of options.
-    
+
+    Only a scrolling window of the options is shown, and typing filters the list.
+
     Args:
         prompt: The prompt message to display
         options: List of options to choose from
         default_index: Default selected option index (0-based)
-        allow_empty: If True, allows user to exit without selecting (returns None)
         show_cursor: If True, shows a cursor indicator next to the selected option
-        
+        max_visible: Maximum number of options shown at once. Defaults to what fits the terminal
+
     Returns:
-        The selected option string, or None if allow_empty is True and user cancels
-    """ 
+        The index of the selected option in `options`
+    """
     console = Console()
-    selected_index = max(0, min(default_index, len(options) - 1))
-    
+    index = _OptionIndex(options)
+    selected = max(0, min(default_index, len(options) - 1))  # position within index.matches
+    visible = max_visible or max(3, console.size.height - 6)
+    visible = max(1, min(visible, len(options)))
+    top = max(0, min(selected - visible // 2, len(options) - visible))
+
+    def _rows() -> List[RenderableType]:
+        matches = index.matches
+        rows: List[RenderableType] = []
+        for position in range(top, top + visible):
+            row = Text(no_wrap=True, overflow="ellipsis")
+            if position < len(matches):
+                option = options[matches[position]]
+                if position == selected:
+                    if show_cursor:
+                        row.append("> ", style="bold yellow")
+                    row.append(option, style="bold yellow")
+                else:
+                    if show_cursor:
+                        row.append("  ")
+                    row.append(option)
+            elif position == 0:
+                row.append("  (no matches)", style="dim")
+            rows.append(row)
+        return rows
+
+    def _frame() -> List[RenderableType]:
+        query = Text(no_wrap=True, overflow="ellipsis")
+        if index.query:
+            query.append("Filter: ", style="dim")
+            query.append(index.query, style="bold")
+        count = len(index.matches)
+        help_text = "Use ↑/↓ to navigate, type to filter, Enter to select"
+        if count > visible:
+            help_text += f" ({min(selected + 1, count)}/{count})"
+        return [
+            Text(prompt, no_wrap=True, overflow="ellipsis"),
+            query,
+            *_rows(),
+            Text(""),
+            Text(help_text, style="dim", no_wrap=True, overflow="ellipsis"),
+        ]
+
+    def _scroll_into_view() -> None:
+        nonlocal top
+        if selected < top:
+            top = selected
+        elif selected >= top + visible:
+            top = selected - visible + 1
+        top = max(0, min(top, max(len(index.matches) - visible, 0)))
+
     @hideCursor
     def _display_selector() -> int:
-        nonlocal selected_index
-        
-        # Create the display content
-        content = Text()
-        content.append(prompt + "\n\n")
-        
-        # Display each option
-        for i, option in enumerate(options):
-            if i == selected_index:
-                # Highlight selected option
-                if show_cursor:
-                    content.append("> ", style="bold yellow")
-                content.append(option, style="bold yellow")
-            else:
-                # Regular option
-                if show_cursor:
-                    content.append("  ")
-                content.append(option)
-            
-            if i < len(options) - 1:
-                content.append("\n")
-        
-        # Display instructions
-        content.append("\n\nUse ↑/↓ to navigate, Enter to select", style="dim")
-        
-        console.print(content)
-        
-        # Get user input
-        while True:
-            key = getKey()
-            
-            if key == KEY_CODE['up']:
-                selected_index = (selected_index - 1) % len(options)
-                # Clear the previous display and redraw
-                removeLines(len(options) + 4)
-                return _display_selector()
-                
-            elif key == KEY_CODE['down']:
-                selected_index = (selected_index + 1) % len(options)
-                # Clear the previous display and redraw
-                removeLines(len(options) + 4)
-                return _display_selector()
-                
-            elif key == KEY_CODE['enter']:
-                # Clear the selector display
-                removeLines(len(options) + 4)
-                return selected_index
-                
-            elif key == KEY_CODE['ctrl_c']:
-                exit(0)
-    
+        nonlocal selected
+        block = _LiveBlock(console)
+        with rawMode():
+            block.update(_frame())
+            while True:
+                key = getKey()
+                count = len(index.matches)
+
+                if key == KEY_CODE['enter']:
+                    if count:
+                        block.clear()
+                        return index.matches[selected]
+                    continue
+
+                elif key == KEY_CODE['ctrl_c']:
+                    block.clear()
+                    exit(0)
+
+                elif count and key == KEY_CODE['up']:
+                    selected = (selected - 1) % count
+                elif count and key == KEY_CODE['down']:
+                    selected = (selected + 1) % count
+                elif count and key == KEY_CODE['page_up']:
+                    selected = max(selected - visible, 0)
+                elif count and key == KEY_CODE['page_down']:
+                    selected = min(selected + visible, count - 1)
+                elif key == KEY_CODE['home']:
+                    selected = 0
+                elif count and key == KEY_CODE['end']:
+                    selected = count - 1
+
+                elif key in (KEY_CODE['backspace'], '\x08', KEY_CODE['ctrl_u']):
+                    if not index.query:
+                        continue
+                    current = index.matches[selected] if count else None
+                    if key == KEY_CODE['ctrl_u']:
+                        index.reset()
+                    else:
+                        index.pop()
+                    # Keep the highlighted option selected when the list widens
+                    selected = index.matches.index(current) if current is not None else 0
+                elif len(key) == 1 and key.isprintable():
+                    current = index.matches[selected] if count else None
+                    index.push(key)
+                    matches = index.matches
+                    selected = matches.index(current) if current in matches else 0
+                else:
+                    continue
+
+                _scroll_into_view()
+                block.update(_frame())
+
     ret = _display_selector()
-    # Remove all the lines and print the selected option\
+    # Remove all the lines and print the selected option
     console.print(prompt, end=" ")
     console.print(options[ret], style="bold yellow", highlight=False)
     return ret
@@ -102,24 +239,21 @@ def panel_select(
     from rich.align import Align
 
     selected_index = max(0, min(default_index, len(options) - 1))
-    
-    @hideCursor
-    def _display_panel_selector() -> int:
-        nonlocal selected_index
-        
+
+    def _panel() -> RenderableType:
         # Create the panel content
         content = Text()
         content.append(prompt + "\n\n")
-        
+
         # Calculate padding for horizontal layout
         padding = " " * 2  # Padding on both sides
-        
+
         # Create a horizontal layout for options
         options_line = Text()
-        
+
         # Add left padding
         options_line.append(padding)
-        
+
         # Display each option horizontally
         for i, option in enumerate(options):
             if i == selected_index:
@@ -128,51 +262,56 @@ def panel_select(
             else:
                 # Regular option
                 options_line.append(option)
-            
+
             # Add spacing between options
             if i < len(options) - 1:
                 options_line.append(" " * 4)  # Spacing between options
-        
+
         # Add right padding
         options_line.append(padding)
-        
+
         content.append(options_line)
-        
+
         panel = Panel(
             Align.center(content, vertical="middle"),
             title=panel_title,
             border_style=color,
             width=max_width,
         )
-        
-        console.print(panel, justify="center")
-        
-        # Get user input
-        while True:
-            key = getKey()
-            
-            if key == KEY_CODE['left']:
-                selected_index = (selected_index - 1) % len(options)
-                # Clear the previous display and redraw
-                removeLines(5)
-                return _display_panel_selector()
-                
-            elif key == KEY_CODE['right']:
-                selected_index = (selected_index + 1) % len(options)
-                # Clear the previous display and redraw
-                removeLines(5)
-                return _display_panel_selector()
-                
-            elif key == KEY_CODE['enter']:
-                # Clear the selector display
-                removeLines(5)
-                return selected_index
-                
-            elif key == KEY_CODE['ctrl_c']:
-                exit(0)
-    
+        return Align.center(panel)
+
+    @hideCursor
+    def _display_panel_selector() -> int:
+        nonlocal selected_index
+        # Only the options line changes between keypresses, so only it is repainted
+        block = _LiveBlock(console)
+        with rawMode():
+            block.update([_panel()])
+            while True:
+                key = getKey()
+
+                if key == KEY_CODE['left']:
+                    selected_index = (selected_index - 1) % len(options)
+
+                elif key == KEY_CODE['right']:
+                    selected_index = (selected_index + 1) % len(options)
+
+                elif key == KEY_CODE['enter']:
+                    # Clear the selector display
+                    block.clear()
+                    return selected_index
+
+                elif key == KEY_CODE['ctrl_c']:
+                    block.clear()
+                    exit(0)
+
+                else:
+                    continue
+
+                block.update([_panel()])
+
     ret = _display_panel_selector()
     # Remove all the lines and print the selected option
     console.print(prompt, end=" ")
     console.print(options[ret], style="bold yellow", highlight=False)
-    return ret
\ No newline at end of file
+    return ret
@@ -1,16 +1,19 @@
 from .console import (
     getKey,
+    rawMode,
     hideCursor,
     removeLines,
     readUntilEOF,
 )
 
 KEY_CODE = {
-    'up': '\x1b[A', "down": '\x1b[B', "right": '\x1b[C', "left": '\x1b[D', "enter": '\r', "space": ' ', "ctrl_c": '\x03'
+    'up': '\x1b[A', "down": '\x1b[B', "right": '\x1b[C', "left": '\x1b[D', "enter": '\r', "space": ' ', "ctrl_c": '\x03',
+    "page_up": '\x1b[5~', "page_down": '\x1b[6~', "home": '\x1b[H', "end": '\x1b[F', "backspace": '\x7f', "ctrl_u": '\x15'
 }
 
 __all__ = [
     'getKey',
+    'rawMode',
     'hideCursor',
     'removeLines',
     'KEY_CODE',
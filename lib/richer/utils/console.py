@@ -1,18 +1,64 @@
 import sys
 import tty
 import termios
+from contextlib import contextmanager
+
+_raw_depth = 0
+
+def _readKey() -> str:
+    key = sys.stdin.read(1)  # Read a single character
+
+    if key == '\x1b':
+        key += sys.stdin.read(2)
+        # Sequences like page up (ESC [ 5 ~) carry a numeric parameter and end with '~'
+        while key[-1].isdigit() or key[-1] == ';':
+            key += sys.stdin.read(1)
+    return key
+
+@contextmanager
+def rawMode():
+    """
+    Context manager that keeps the terminal in raw input mode until it exits.
+
+    Keys are delivered one by one without echo, and Ctrl+C arrives as a key instead of
+    a signal. Output processing stays on, so printing still works as usual. getKey()
+    calls inside the block skip their own mode switching.
+    """
+    global _raw_depth
+    if _raw_depth > 0:
+        _raw_depth += 1
+        try:
+            yield
+        finally:
+            _raw_depth -= 1
+        return
+
+    fd = sys.stdin.fileno()
+    old_settings = termios.tcgetattr(fd)
+    new_settings = termios.tcgetattr(fd)
+    new_settings[0] &= ~(termios.ICRNL | termios.IXON)  # iflag: keep Enter as '\r', no flow control
+    new_settings[3] &= ~(termios.ICANON | termios.ECHO | termios.ISIG | termios.IEXTEN)  # lflag
+    new_settings[6][termios.VMIN] = 1
+    new_settings[6][termios.VTIME] = 0
+    try:
+        termios.tcsetattr(fd, termios.TCSADRAIN, new_settings)
+        _raw_depth = 1
+        yield
+    finally:
+        _raw_depth = 0
+        termios.tcsetattr(fd, termios.TCSADRAIN, old_settings)  # Restore settings
 
 def getKey():
     """Reads a single key press and blocks until a key is pressed."""
+    if _raw_depth > 0:
+        return _readKey()
+
     fd = sys.stdin.fileno()
     old_settings = termios.tcgetattr(fd)
 
     try:
         tty.setraw(fd)  # Set terminal to raw mode (no buffering)
-        key = sys.stdin.read(1)  # Read a single character
-        
-        if key == '\x1b':
-            key += sys.stdin.read(2)
+        key = _readKey()
     finally:
         termios.tcsetattr(fd, termios.TCSADRAIN, old_settings)  # Restore settings
 
@@ -44,4 +90,4 @@ def readUntilEOF() -> str:
         pass
     return "\n".join(lines)
 
-__all__ = ['getKey', 'hideCursor', 'removeLines']
\ No newline at end of file
+__all__ = ['getKey', 'rawMode', 'hideCursor', 'removeLines', 'readUntilEOF']
\ No newline at end of file
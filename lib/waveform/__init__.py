@@ -0,0 +1,11 @@
+from .capture import Capture, load_capture
+from .fit import FitResult, fit_transient, fit_capture, fit_captures
+
+__all__ = [
+    "Capture",
+    "load_capture",
+    "FitResult",
+    "fit_transient",
+    "fit_capture",
+    "fit_captures",
+]
@@ -0,0 +1,98 @@
+import numpy as np
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Optional, Tuple, Union
+
+
+@dataclass
+class Capture:
+    """A single oscilloscope capture: a shared time axis and one or more voltage channels."""
+    time: np.ndarray
+    channels: dict[str, np.ndarray] = field(default_factory=dict)
+    source: Optional[str] = None
+
+    def channel(self, name: Optional[str] = None) -> np.ndarray:
+        """Get a channel by name, or the first channel if no name is given."""
+        if name is None:
+            return next(iter(self.channels.values()))
+        return self.channels[name]
+
+    def window(self, t_start: Optional[float] = None, t_end: Optional[float] = None) -> "Capture":
+        """Return the part of the capture with t_start <= t < t_end, as views into the original arrays."""
+        lo = 0 if t_start is None else int(np.searchsorted(self.time, t_start, side="left"))
+        hi = len(self.time) if t_end is None else int(np.searchsorted(self.time, t_end, side="left"))
+        return Capture(
+            time=self.time[lo:hi],
+            channels={name: values[lo:hi] for name, values in self.channels.items()},
+            source=self.source,
+        )
+
+
+def _is_number(text: str) -> bool:
+    try:
+        float(text)
+    except ValueError:
+        return False
+    return True
+
+
+def _find_data_start(path: Path, delimiter: str, encoding: str, max_header_lines: int = 64) -> Tuple[int, int, Optional[list[str]]]:
+    """Find the first all-numeric row of a CSV file, its column count, and the column names right above it if present."""
+    names = None
+    with open(path, "r", encoding=encoding, errors="replace") as f:
+        for index, line in enumerate(f):
+            fields = [cell.strip() for cell in line.strip().split(delimiter)]
+            if fields and fields[0] and all(_is_number(cell) for cell in fields if cell):
+                # Some exports end every row with a delimiter, giving an empty trailing column
+                while not fields[-1]:
+                    fields.pop()
+                return index, len(fields), names
+            if index >= max_header_lines:
+                break
+            names = fields
+    raise ValueError(f"Could not find numeric data in the first {max_header_lines} lines of {path}.")
+
+
+def load_capture(
+    path: Union[str, Path],
+    delimiter: str = ",",
+    encoding: str = "utf-8",
+    time_scale: float = 1.0,
+    time_increment: Optional[float] = None,
+) -> Capture:
+    """
+    Load an oscilloscope CSV export.
+
+    The header block written by the oscilloscope is skipped automatically. The first
+    column is taken as time and every following column as a channel; column names are
+    taken from the last header line if there is one, otherwise channels are named CH1, CH2...
+
+    Args:
+        path: Path to the CSV file.
+        delimiter: Column delimiter.
+        encoding: File encoding. Try "gb2312" for exports from Chinese-locale oscilloscopes.
+        time_scale: Factor converting the time column to seconds (e.g. 1e-6 for us).
+        time_increment: If the first column is a sample index rather than time (as in
+            some Rigol exports), the sampling interval in seconds.
+
+    Returns:
+        The loaded Capture.
+    """
+
+    path = Path(path)
+    skip, column_count, names = _find_data_start(path, delimiter, encoding)
+    data = np.loadtxt(
+        path, delimiter=delimiter, skiprows=skip, usecols=range(column_count),
+        encoding=encoding, ndmin=2, dtype=np.float64,
+    )
+
+    time = data[:, 0] * (time_increment if time_increment is not None else time_scale)
+    channel_count = data.shape[1] - 1
+    header = names[1:channel_count + 1] if names is not None else []
+    if len(header) < channel_count or not all(header) or len(set(header)) < channel_count:
+        names = ["time"] + [f"CH{i + 1}" for i in range(channel_count)]
+    channels = {names[i + 1]: data[:, i + 1] for i in range(channel_count)}
+    return Capture(time=time, channels=channels, source=str(path))
+
+
+__all__ = ["Capture", "load_capture"]
@@ -0,0 +1,271 @@
+import numpy as np
+from dataclasses import dataclass, field
+from pathlib import Path
+from scipy.optimize import least_squares
+from scipy.signal import hilbert
+from typing import Callable, Iterable, Literal, Optional, Tuple, Union
+
+from .capture import Capture, load_capture
+
+ModelName = Literal["exponential", "damped"]
+
+
+@dataclass
+class FitResult:
+    """
+    Result of fitting a transient model to a capture.
+
+    Attributes:
+        model: Name of the fitted model.
+        params: Best-fit values, keyed by parameter name.
+        errors: One standard deviation uncertainties, keyed by parameter name.
+        r_squared: Coefficient of determination of the fit.
+        t0: Time (in seconds) that the model's t = 0 corresponds to.
+        source: Path of the capture the fit came from, if any.
+    """
+    model: str
+    params: dict[str, float]
+    errors: dict[str, float]
+    r_squared: float
+    t0: float = 0.0
+    source: Optional[str] = None
+    covariance: np.ndarray = field(default_factory=lambda: np.empty((0, 0)), repr=False)
+
+    def ufloat(self, name: str):
+        """Get a parameter as an `uncertainties.ufloat`, ready for error propagation."""
+        from uncertainties import ufloat
+
+        return ufloat(self.params[name], self.errors[name])
+
+    def evaluate(self, t: np.ndarray) -> np.ndarray:
+        """Evaluate the fitted curve at absolute times t."""
+        values, _ = MODELS[self.model][0](np.asarray(t, dtype=np.float64) - self.t0, self._vector())
+        return values
+
+    def _vector(self) -> np.ndarray:
+        return np.array([self.params[name] for name in MODELS[self.model][1]])
+
+
+def _exponential(t: np.ndarray, p: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """u(t) = c + a * exp(-t / tau), with its Jacobian."""
+    c, a, tau = p
+    decay = np.exp(-t / tau)
+    jac = np.empty((t.size, 3))
+    jac[:, 0] = 1.0
+    jac[:, 1] = decay
+    jac[:, 2] = a * decay * t / tau**2
+    return c + a * decay, jac
+
+
+def _damped(t: np.ndarray, p: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """u(t) = c + a * exp(-beta * t) * cos(omega * t + phi), with its Jacobian."""
+    c, a, beta, omega, phi = p
+    envelope = np.exp(-beta * t)
+    angle = omega * t + phi
+    cos, sin = np.cos(angle), np.sin(angle)
+    jac = np.empty((t.size, 5))
+    jac[:, 0] = 1.0
+    jac[:, 1] = envelope * cos
+    jac[:, 2] = -a * t * envelope * cos
+    jac[:, 3] = -a * t * envelope * sin
+    jac[:, 4] = -a * envelope * sin
+    return c + a * envelope * cos, jac
+
+
+MODELS: dict[str, Tuple[Callable[[np.ndarray, np.ndarray], Tuple[np.ndarray, np.ndarray]], Tuple[str, ...]]] = {
+    "exponential": (_exponential, ("c", "a", "tau")),
+    "damped": (_damped, ("c", "a", "beta", "omega_d", "phi")),
+}
+
+
+def _guess_exponential(t: np.ndarray, y: np.ndarray) -> np.ndarray:
+    tail = max(y.size // 20, 1)
+    c = y[-tail:].mean()
+    a = y[:tail].mean() - c
+    # Slope of ln|y - c| over the part well above the noise floor gives -1/tau
+    residual = np.abs(y - c)
+    usable = residual > 0.1 * abs(a)
+    if np.count_nonzero(usable) >= 2:
+        slope = np.polyfit(t[usable], np.log(residual[usable]), 1)[0]
+    else:
+        slope = 0.0
+    tau = -1 / slope if slope < 0 else (t[-1] - t[0]) / 5
+    return np.array([c, a, tau])
+
+
+def _guess_damped(t: np.ndarray, y: np.ndarray) -> np.ndarray:
+    tail = max(y.size // 10, 1)
+    c = y[-tail:].mean()
+    ac = y - c
+    dt = (t[-1] - t[0]) / (t.size - 1)
+    spectrum = np.abs(np.fft.rfft(ac))
+    spectrum[0] = 0.0
+    omega = 2 * np.pi * np.fft.rfftfreq(ac.size, dt)[np.argmax(spectrum)]
+    analytic = hilbert(ac)
+    envelope = np.abs(analytic)
+    usable = envelope > 0.1 * envelope.max()
+    slope = np.polyfit(t[usable], np.log(envelope[usable]), 1)[0] if np.count_nonzero(usable) >= 2 else 0.0
+    beta = max(-slope, 0.0)
+    a = envelope[0] if envelope[0] > 0 else envelope.max()
+    phi = float(np.angle(analytic[0]))
+    return np.array([c, a, beta, omega, phi])
+
+
+GUESSES = {
+    "exponential": _guess_exponential,
+    "damped": _guess_damped,
+}
+
+
+def fit_transient(
+    t: np.ndarray,
+    y: np.ndarray,
+    model: ModelName = "exponential",
+    initial: Optional[dict[str, float]] = None,
+    max_samples: Optional[int] = 200_000,
+) -> FitResult:
+    """
+    Fit a transient model to sampled data by nonlinear least squares.
+
+    Models:
+        - "exponential": u(t) = c + a * exp(-t / tau), for RC/RL charge and discharge.
+        - "damped": u(t) = c + a * exp(-beta * t) * cos(omega_d * t + phi), for underdamped RLC.
+
+    Time is measured from the first sample. The residuals and the analytic Jacobian are
+    evaluated on whole arrays at once, so a fit costs a handful of vectorized passes.
+
+    Args:
+        t (np.ndarray): Sample times in seconds, increasing.
+        y (np.ndarray): Sampled voltages.
+        model (str): Model name, see above.
+        initial (dict, optional): Starting values overriding the automatic guess.
+        max_samples (int, optional): If the capture is longer, it is decimated evenly to
+            about this many samples before fitting. None fits every sample.
+
+    Returns:
+        The FitResult, with one standard deviation uncertainties from the covariance matrix.
+    """
+
+    if model not in MODELS:
+        raise ValueError(f"Unknown model: {model}")
+    func, names = MODELS[model]
+
+    t = np.asarray(t, dtype=np.float64)
+    y = np.asarray(y, dtype=np.float64)
+    if t.shape != y.shape or t.size <= len(names):
+        raise ValueError("t and y must have the same length, longer than the number of parameters.")
+    if max_samples is not None and t.size > max_samples:
+        stride = -(-t.size // max_samples)
+        t, y = t[::stride], y[::stride]
+
+    t0 = t[0]
+    t = t - t0
+    p0 = GUESSES[model](t, y)
+    if initial:
+        for key, value in initial.items():
+            p0[names.index(key)] = value
+
+    solution = least_squares(
+        lambda p: func(t, p)[0] - y,
+        p0,
+        jac=lambda p: func(t, p)[1],
+        method="lm",
+        x_scale="jac",
+    )
+
+    residual = solution.fun
+    dof = max(t.size - len(names), 1)
+    variance = residual @ residual / dof
+    jac = solution.jac
+    try:
+        covariance = np.linalg.inv(jac.T @ jac) * variance
+    except np.linalg.LinAlgError:
+        covariance = np.full((len(names), len(names)), np.inf)
+    errors = np.sqrt(np.abs(np.diag(covariance)))
+
+    total = y - y.mean()
+    r_squared = 1 - (residual @ residual) / (total @ total) if total.any() else 1.0
+
+    params = dict(zip(names, (float(v) for v in solution.x)))
+    if model == "damped" and params["omega_d"] < 0:
+        # cos(-w t + phi) == cos(w t - phi); report the positive angular frequency
+        params["omega_d"], params["phi"] = -params["omega_d"], -params["phi"]
+    return FitResult(
+        model=model,
+        params=params,
+        errors=dict(zip(names, (float(e) for e in errors))),
+        r_squared=float(r_squared),
+        t0=float(t0),
+        covariance=covariance,
+    )
+
+
+def fit_capture(
+    capture: Union[Capture, str, Path],
+    model: ModelName = "exponential",
+    channel: Optional[str] = None,
+    window: Tuple[Optional[float], Optional[float]] = (None, None),
+    **kwargs,
+) -> FitResult:
+    """
+    Fit one channel of an oscilloscope capture.
+
+    Args:
+        capture: A Capture, or a path to a CSV export to load with `load_capture`.
+        model (str): Model name, see `fit_transient`.
+        channel (str, optional): Channel to fit. Defaults to the first channel.
+        window (tuple): (t_start, t_end) in seconds selecting a single transient,
+            e.g. one half period of the square wave. None leaves that side open.
+        **kwargs: Forwarded to `fit_transient`.
+
+    Returns:
+        The FitResult.
+    """
+
+    if not isinstance(capture, Capture):
+        capture = load_capture(capture)
+    part = capture.window(*window)
+    result = fit_transient(part.time, part.channel(channel), model=model, **kwargs)
+    result.source = capture.source
+    return result
+
+
+def _fit_path(args: Tuple[Union[str, Path], str, Optional[str], Tuple[Optional[float], Optional[float]], dict]) -> FitResult:
+    path, model, channel, window, kwargs = args
+    return fit_capture(path, model, channel=channel, window=window, **kwargs)
+
+
+def fit_captures(
+    paths: Iterable[Union[str, Path]],
+    model: ModelName = "exponential",
+    channel: Optional[str] = None,
+    window: Tuple[Optional[float], Optional[float]] = (None, None),
+    workers: Optional[int] = None,
+    **kwargs,
+) -> list[FitResult]:
+    """
+    Fit many captures with the same model, e.g. a whole class's RC discharge exports.
+
+    Args:
+        paths: Paths to the CSV exports.
+        model (str): Model name, see `fit_transient`.
+        channel (str, optional): Channel to fit in every capture.
+        window (tuple): (t_start, t_end) applied to every capture.
+        workers (int, optional): Number of worker processes. None or 1 fits in this process.
+        **kwargs: Forwarded to `fit_transient`.
+
+    Returns:
+        One FitResult per path, in the same order.
+    """
+
+    jobs = [(path, model, channel, window, kwargs) for path in paths]
+    if workers is None or workers <= 1:
+        return [_fit_path(job) for job in jobs]
+
+    from concurrent.futures import ProcessPoolExecutor
+
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        return list(executor.map(_fit_path, jobs))
+
+
+__all__ = ["FitResult", "fit_transient", "fit_capture", "fit_captures"]